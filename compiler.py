@@ -0,0 +1,330 @@
+"""Compiler: Lowers a statement Block to flat bytecode for the interpreter.
+
+The tree-walking interpreter pays a recursive ``evaluate`` call per node on
+every execution. For Pidgin statements and arithmetic the compiler instead
+emits a flat list of ``(opcode, arg)`` pairs for a stack machine, which the
+interpreter runs in a single loop (see ``Interpreter._run``). Relational and
+other statement nodes are emitted as a single opcode that hands the node back
+to the interpreter, so their semantics live in one place.
+
+Error handling mirrors the tree walker: an expression that fails jumps to the
+error handler of the statement that contains it, which reports the message
+the same way the statement's ``interpret`` branch would. Handlers are emitted
+out of line after the program so the success path never jumps over them.
+"""
+
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from math_operations import MathOperations
+
+from relational.ast_nodes import (
+    AnchorDeclaration, WhenStatement, Assign, Var, Num, Str, Bool, BinOp,
+    UnaryOp, If, While, Print, Block, NumberLiteral, StringLiteral, BooleanLiteral
+)
+
+
+class Op(IntEnum):
+    """Bytecode opcodes; values index the interpreter's handler table."""
+    LOAD_CONST = 0      # arg: value                -> push value
+    LOAD_VAR = 1        # arg: (Var node, err_pc)   -> push node._slot_idx
+    BINOP = 2           # arg: (BinOp node, err_pc) -> pop 2, push node._op_fn(...)
+    UNARYOP = 3         # arg: (UnaryOp, err_pc)    -> pop 1, push result
+    EVAL_NODE = 4       # arg: (node, err_pc)       -> push evaluate(node)
+    STORE_VAR = 5       # arg: slot index           -> pop into variable
+    PRINT = 6           # arg: None                 -> pop and print
+    SET_RESULT = 7      # arg: None                 -> pop into result
+    CLEAR_RESULT = 8    # arg: None                 -> result = None
+    JUMP = 9            # arg: target pc
+    JUMP_IF_FALSE = 10  # arg: target pc            -> pop, jump if falsy
+    REPORT_ERROR = 11   # arg: (prefix, always)     -> print pending error
+    EXEC_NODE = 12      # arg: node                 -> result = interpret(node)
+    ANCHOR_DECL = 13    # arg: AnchorDeclaration
+    WHEN_CHECK = 14     # arg: WhenStatement
+    # Quickened forms of BINOP, written over it by the interpreter at run
+    # time once the operand types are known; never emitted by the compiler
+    BINOP_FLOAT = 15    # arg: (BinOp, err_pc, fn, deopts) -> float op float
+    BINOP_NUMBER = 16   # arg: (BinOp, err_pc, fn, deopts) -> int/float mix
+    # Fused loop test for `while <var>`: no stack traffic, no separate jump
+    WHILE_VAR = 17      # arg: (Var node, err_pc, exit pc)
+    # Whole-loop escape hatch for pure arithmetic While bodies
+    NUMERIC_LOOP = 18   # arg: (loop fn, guarded slots, exit pc)
+
+
+N_OPCODES = len(Op)
+
+Instruction = Tuple[int, Any]
+
+# Variable names are numbered program-wide rather than per interpreter, so
+# bytecode cached on the AST stays valid for every Interpreter that runs it
+SLOT_OF: Dict[str, int] = {}
+SLOT_NAMES: List[str] = []
+
+
+def slot_for(name: str) -> int:
+    """Return the variable slot index for ``name``, allocating one if new."""
+    index = SLOT_OF.get(name)
+    if index is None:
+        index = SLOT_OF[name] = len(SLOT_NAMES)
+        SLOT_NAMES.append(name)
+    return index
+
+# Literal node types whose value can be folded into LOAD_CONST
+_LITERAL_TYPES = frozenset((Num, Str, Bool, NumberLiteral, StringLiteral, BooleanLiteral))
+
+# Operators a numeric loop may use: on floats they can never fail, so the
+# generated code needs no error paths (division and power can)
+_LOOP_OPERATORS = {'plus': '+', 'minus': '-', 'times': '*'}
+
+
+def compile_numeric_loop(node: While) -> Optional[Tuple[Callable, Tuple[int, ...]]]:
+    """
+    Generate a plain Python function that runs ``node`` to completion.
+
+    Only loops whose condition is a variable and whose body is nothing but
+    assignments of plus/minus/times arithmetic over variables and number
+    literals qualify. The function works on local variables instead of the
+    VM stack and writes them back to the slot list when the loop exits.
+
+    Returns:
+        (function taking the slot list, slots that must hold numbers for
+        the function to be used), or None if the loop does not qualify
+    """
+    if type(node.condition) is not Var:
+        return None
+    body = node.body
+    statements = body.statements if type(body) is Block else [body]
+    if not statements or any(type(stmt) is not Assign for stmt in statements):
+        return None
+
+    reads: Set[int] = {slot_for(node.condition.name)}
+    writes: Set[int] = set()
+
+    def expr(operand, as_float: bool) -> Optional[str]:
+        operand_type = type(operand)
+        if operand_type is Var:
+            index = operand._slot_idx = slot_for(operand.name)
+            reads.add(index)
+            return f"float(v{index})" if as_float else f"v{index}"
+        if operand_type in (Num, NumberLiteral):
+            value = operand.value
+            if type(value) not in (int, float):
+                return None
+            return repr(float(value) if as_float else value)
+        if operand_type is BinOp:
+            symbol = _LOOP_OPERATORS.get(MathOperations.normalize_operator(operand.op)[0])
+            left = expr(operand.left, True)
+            right = expr(operand.right, True)
+            if symbol is None or left is None or right is None:
+                return None
+            return f"({left} {symbol} {right})"
+        return None
+
+    lines = [f"    while v{slot_for(node.condition.name)}:"]
+    for stmt in statements:
+        source = expr(stmt.expr, False)
+        if source is None:
+            return None
+        index = slot_for(stmt.var)
+        writes.add(index)
+        lines.append(f"        v{index} = {source}")
+
+    used = sorted(reads | writes)
+    source = "\n".join(
+        ["def _numeric_loop(slots):"]
+        + [f"    v{index} = slots[{index}]" for index in used]
+        + ["    try:"]
+        + ["    " + line for line in lines]
+        + ["    finally:"]
+        + [f"        slots[{index}] = v{index}" for index in sorted(writes)]
+    )
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<numeric-loop>", "exec"), namespace)
+    return namespace["_numeric_loop"], tuple(sorted(reads))
+
+
+class Compiler:
+    """
+    Single-pass AST to bytecode compiler.
+
+    Only exact node types are lowered; anything else (including subclasses)
+    falls back to EXEC_NODE/EVAL_NODE so the interpreter's own dispatch
+    decides how it runs.
+    """
+
+    def __init__(self) -> None:
+        self.code: List[Instruction] = []
+        # Pending error handlers: (failing instructions, report arg, resume pc)
+        self._handlers: List[Tuple[List[int], Tuple[str, bool], int]] = []
+
+    def compile(self, node) -> List[Instruction]:
+        """Compile a statement (usually the root Block) to bytecode."""
+        self.code = []
+        self._handlers = []
+        self._compile_statement(node)
+        if self._handlers:
+            # Step over the out-of-line handlers once the program is done
+            halt = self._emit(Op.JUMP)
+            for fails, report, resume in self._handlers:
+                self._patch_errors(fails, self._emit(Op.REPORT_ERROR, report))
+                self._emit(Op.JUMP, resume)
+            self._patch_jump(halt, len(self.code))
+        return self.code
+
+    # ========================================================================
+    # EMISSION HELPERS
+    # ========================================================================
+
+    def _emit(self, op: Op, arg: Any = None) -> int:
+        # Plain ints index the handler list faster than IntEnum members
+        self.code.append((int(op), arg))
+        return len(self.code) - 1
+
+    def _patch_jump(self, index: int, target: int) -> None:
+        self.code[index] = (self.code[index][0], target)
+
+    def _on_error(self, fails: List[int], prefix: str, always: bool, resume: int) -> None:
+        """Queue an error handler that reports and continues at ``resume``"""
+        if fails:
+            self._handlers.append((fails, (prefix, always), resume))
+
+    def _patch_errors(self, fails: List[int], target: int) -> None:
+        """Point every failing expression instruction at its error handler"""
+        code = self.code
+        for index in fails:
+            op, arg = code[index]
+            code[index] = (op, (arg[0], target) + arg[2:])
+
+    # ========================================================================
+    # STATEMENTS
+    # ========================================================================
+
+    def _compile_statement(self, node) -> None:
+        node_type = type(node)
+
+        if node_type is Block:
+            for stmt in node.statements:
+                self._compile_statement(stmt)
+
+        elif node_type is Assign:
+            self._guarded(node.expr, (Op.STORE_VAR, slot_for(node.var)), "Error: ", True)
+
+        elif node_type is Print:
+            self._guarded(node.expr, (Op.PRINT, None), "", True)
+
+        elif node_type is If:
+            self._compile_if(node)
+
+        elif node_type is While:
+            self._compile_while(node)
+
+        elif node_type is AnchorDeclaration:
+            self._emit(Op.ANCHOR_DECL, node)
+
+        elif node_type is WhenStatement:
+            self._emit(Op.WHEN_CHECK, node)
+
+        elif node_type in _LITERAL_TYPES or node_type in (Var, BinOp, UnaryOp):
+            # Bare expression statement; errors only shown when explaining
+            self._guarded(node, (Op.SET_RESULT, None), "", False)
+
+        else:
+            self._emit(Op.EXEC_NODE, node)
+
+    def _guarded(self, expr, store: Instruction, prefix: str, always: bool) -> None:
+        """Compile ``expr`` followed by ``store``; errors skip the store"""
+        fails: List[int] = []
+        self._compile_expr(expr, fails)
+        self._emit(*store)
+        self._on_error(fails, prefix, always, len(self.code))
+
+    def _compile_if(self, node: If) -> None:
+        """
+        Layout::
+
+            <cond>; JUMP_IF_FALSE else
+            <then>; JUMP end
+            else: <else>
+            end: CLEAR_RESULT
+        """
+        fails: List[int] = []
+        self._compile_expr(node.condition, fails)
+        to_else = self._emit(Op.JUMP_IF_FALSE)
+        self._compile_statement(node.then_branch)
+        if node.else_branch:
+            to_end = self._emit(Op.JUMP)
+            self._patch_jump(to_else, len(self.code))
+            self._compile_statement(node.else_branch)
+            self._patch_jump(to_end, len(self.code))
+        else:
+            self._patch_jump(to_else, len(self.code))
+        self._on_error(fails, "Error: ", True, len(self.code))
+        self._emit(Op.CLEAR_RESULT)
+
+    def _compile_while(self, node: While) -> None:
+        """
+        Layout::
+
+            top: <cond>; JUMP_IF_FALSE end
+            <body>; JUMP top
+            end: CLEAR_RESULT
+        
+        A bare variable condition (``while count``) is the common loop
+        shape, since the language has no comparison operators; its test
+        is fused into a single WHILE_VAR instruction. Pure arithmetic
+        loops are additionally preceded by a NUMERIC_LOOP instruction that
+        runs the whole loop as generated Python when its variables hold
+        numbers, and otherwise falls through to the bytecode loop.
+        """
+        numeric = compile_numeric_loop(node)
+        if numeric is not None:
+            shortcut = self._emit(Op.NUMERIC_LOOP, numeric)
+        top = len(self.code)
+        fails: List[int] = []
+        condition = node.condition
+        if type(condition) is Var:
+            condition._slot_idx = slot_for(condition.name)
+            test = self._emit(Op.WHILE_VAR, (condition, None, None))
+            fails.append(test)
+        else:
+            self._compile_expr(condition, fails)
+            test = self._emit(Op.JUMP_IF_FALSE)
+        self._compile_statement(node.body)
+        self._emit(Op.JUMP, top)
+        if type(condition) is Var:
+            op, arg = self.code[test]
+            self.code[test] = (op, arg[:2] + (len(self.code),))
+        else:
+            self._patch_jump(test, len(self.code))
+        self._on_error(fails, "Error: ", True, len(self.code))
+        if numeric is not None:
+            self.code[shortcut] = (int(Op.NUMERIC_LOOP), numeric + (len(self.code),))
+        self._emit(Op.CLEAR_RESULT)
+
+    # ========================================================================
+    # EXPRESSIONS
+    # ========================================================================
+
+    def _compile_expr(self, node, fails: List[int]) -> None:
+        """Post-order walk; instructions that can fail are recorded in ``fails``"""
+        node_type = type(node)
+
+        if node_type in _LITERAL_TYPES:
+            self._emit(Op.LOAD_CONST, node.value)
+
+        elif node_type is Var:
+            node._slot_idx = slot_for(node.name)
+            fails.append(self._emit(Op.LOAD_VAR, (node, None)))
+
+        elif node_type is BinOp:
+            self._compile_expr(node.left, fails)
+            self._compile_expr(node.right, fails)
+            node._op_fn = MathOperations.binary_handler(node.op)
+            fails.append(self._emit(Op.BINOP, (node, None)))
+
+        elif node_type is UnaryOp:
+            self._compile_expr(node.operand, fails)
+            fails.append(self._emit(Op.UNARYOP, (node, None)))
+
+        else:
+            fails.append(self._emit(Op.EVAL_NODE, (node, None)))
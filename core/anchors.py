@@ -5,14 +5,78 @@ Genesis 1:1 - In the beginning...
 Anchors are first-class reference points that give meaning to values.
 They represent significant boundaries, thresholds, or targets in the domain.
 """
+import logging
+from bisect import bisect_left, insort
+import sys
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Optional, List, Dict, Callable
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Any, Optional, List, Dict, Callable, Mapping, Tuple
 from .types import NumericType
 from .exceptions import InvalidAnchorRangeError
 
 
-@dataclass
+_log = logging.getLogger(__name__)
+
+# Wall-clock/monotonic pair captured once at import. Hot paths record
+# time.monotonic() floats; datetimes are only built from them on demand.
+_EPOCH = datetime.now()
+_MONO_EPOCH = time.monotonic()
+_MONO_EPOCH_NS = time.monotonic_ns()
+
+# The numeric test shared with core.relations: isinstance(v, _NUMERIC_TYPES),
+# so bool and int/float subclasses count as numeric everywhere
+_NUMERIC_TYPES = (int, float)
+
+
+def _bulk_distances(values, point: float) -> List[float]:
+    """Absolute distances from ``point`` to every value in one pass."""
+    point = float(point)
+    return [abs(float(v) - point) for v in values]
+
+
+# Upper (inclusive) distance/tolerance ratios of the significance levels
+# below EXTREME; bisect_left maps a ratio to its level code
+_SIGNIFICANCE_THRESHOLDS = (0.1, 1.0, 2.0, 5.0)
+
+
+def _significance_code(ratio: float) -> int:
+    """
+    Significance code for a distance/tolerance ratio.
+    
+    Codes follow the RelationSignificance order: 0=NEGLIGIBLE,
+    1=NOTICEABLE, 2=SIGNIFICANT, 3=CRITICAL, 4=EXTREME.
+    """
+    if ratio != ratio:
+        return 4  # NaN compares false everywhere: treat as EXTREME
+    return bisect_left(_SIGNIFICANCE_THRESHOLDS, ratio)
+
+
+def _bulk_significance(distances, safe_tolerances) -> List[int]:
+    """
+    Significance codes for parallel distance/tolerance arrays.
+    
+    Tolerances must already be clamped to at least 0.01.
+    """
+    return [_significance_code(d / tol) for d, tol in zip(distances, safe_tolerances)]
+
+
+def _check_bounds(tolerance: float, range_start: Optional[NumericType],
+                  range_end: Optional[NumericType], buffer_zone: float):
+    """Raise if a combination of anchor bound properties is invalid."""
+    if range_start is not None and range_end is not None:
+        if range_start > range_end:
+            raise InvalidAnchorRangeError(range_start, range_end)
+    
+    if tolerance < 0:
+        raise ValueError(f"Tolerance must be non-negative, got {tolerance}")
+    
+    if buffer_zone < 0:
+        raise ValueError(f"Buffer zone must be non-negative, got {buffer_zone}")
+
+
+@dataclass(slots=True)
 class AnchorMetadata:
     """
     Metadata for anchors to track context and significance.
@@ -25,7 +89,10 @@ class AnchorMetadata:
     unit: Optional[str] = None
     context: str = "default"
     source: str = "program"
-    created_at: datetime = field(default_factory=datetime.now)
+    # None means now. Until first read these two fields may hold raw
+    # monotonic stamps; the properties attached below the class turn them
+    # into datetimes
+    created_at: Optional[datetime] = None
     confidence: float = 1.0  # 0.0 to 1.0
     
     # Dynamic properties
@@ -39,12 +106,54 @@ class AnchorMetadata:
     dependencies: List[str] = field(default_factory=list)
     
     def __post_init__(self):
-        """Validate metadata values."""
+        """Validate metadata values and intern identifier strings."""
+        if _created_at_slot.__get__(self) is None:
+            _created_at_slot.__set__(self, time.monotonic_ns())
+        
         if not 0.0 <= self.confidence <= 1.0:
             raise ValueError(f"Confidence must be between 0.0 and 1.0, got {self.confidence}")
+        
+        # Interned so duplicates share storage and compare by identity
+        self.name = sys.intern(self.name)
+        self.context = sys.intern(self.context)
+        self.source = sys.intern(self.source)
+
+
+def _stamp_property(slot, to_datetime: Callable[[Any], datetime], doc: str) -> property:
+    """
+    Property over a slot holding a datetime or a raw monotonic stamp.
+    
+    A stamp is converted on first read and the datetime written back, so
+    repr, ==, asdict and pickling all see datetimes. Assigned values are
+    stored unchanged.
+    """
+    def get(metadata):
+        value = slot.__get__(metadata)
+        if isinstance(value, (int, float)):
+            value = to_datetime(value)
+            slot.__set__(metadata, value)
+        return value
+    
+    return property(get, slot.__set__, doc=doc)
 
 
-@dataclass
+_created_at_slot = AnchorMetadata.created_at
+_last_updated_slot = AnchorMetadata.last_updated
+
+# Stamps: time.monotonic_ns() for created_at, time.monotonic() for last_updated
+AnchorMetadata.created_at = _stamp_property(
+    _created_at_slot,
+    lambda ns: _EPOCH + timedelta(microseconds=(ns - _MONO_EPOCH_NS) // 1000),
+    "Creation time.",
+)
+AnchorMetadata.last_updated = _stamp_property(
+    _last_updated_slot,
+    lambda ts: _EPOCH + timedelta(seconds=ts - _MONO_EPOCH),
+    "Time of the last dynamic refresh, or None.",
+)
+
+
+@dataclass(slots=True, init=False)
 class Anchor:
     """
     First-class anchor representation.
@@ -76,25 +185,91 @@ class Anchor:
     range_end: Optional[NumericType] = None
     buffer_zone: float = 0.0
     
-    # Cached value for dynamic anchors
+    # Cached value for dynamic anchors (mirrors value for static ones)
     _cached_value: Any = field(default=None, init=False, repr=False)
-    _cache_timestamp: Optional[datetime] = field(default=None, init=False, repr=False)
+    _cache_ts: float = field(default=0.0, init=False, repr=False)  # monotonic
     
-    def __post_init__(self):
-        """Validate anchor properties."""
-        if self.range_start is not None and self.range_end is not None:
-            if self.range_start > self.range_end:
-                raise InvalidAnchorRangeError(self.range_start, self.range_end)
-        
-        if self.tolerance < 0:
-            raise ValueError(f"Tolerance must be non-negative, got {self.tolerance}")
+    # Bumped whenever the effective value or bounds change
+    generation: int = field(default=0, init=False, repr=False)
+    
+    # Static anchors take the direct path in current_value
+    _static: bool = field(default=True, init=False, repr=False)
+    
+    # Derived bounds, recomputed whenever a bound field is assigned
+    _critical: bool = field(default=False, init=False, repr=False)
+    _safe_tolerance: float = field(default=0.01, init=False, repr=False)  # >= 0.01 divisor
+    _range_lo_buf: Optional[float] = field(default=None, init=False, repr=False)
+    _range_hi_buf: Optional[float] = field(default=None, init=False, repr=False)
+    
+    def __init__(self, name: str, value: Any, metadata: AnchorMetadata,
+                 tolerance: float = 0.0,
+                 range_start: Optional[NumericType] = None,
+                 range_end: Optional[NumericType] = None,
+                 buffer_zone: float = 0.0):
+        """Validate anchor properties and initialize derived state."""
+        _check_bounds(tolerance, range_start, range_end, buffer_zone)
         
-        if self.buffer_zone < 0:
-            raise ValueError(f"Buffer zone must be non-negative, got {self.buffer_zone}")
+        # value and the bound fields are properties (attached below the
+        # class) that expect a fully built anchor, so write their slots
+        self.name = name
+        _anchor_value_slot.__set__(self, value)
+        self.metadata = metadata
+        self._store_bounds(tolerance, range_start, range_end, buffer_zone)
+        self.generation = 0
         
         # Initialize cached value
-        self._cached_value = self.value
-        self._cache_timestamp = datetime.now()
+        self._static = not metadata.is_dynamic
+        self._cached_value = value
+        self._cache_ts = time.monotonic()
+    
+    def _store_bounds(self, tolerance: float, range_start: Optional[NumericType],
+                      range_end: Optional[NumericType], buffer_zone: float):
+        """Write validated bounds to their slots and precompute range-check constants."""
+        tolerance_slot, range_start_slot, range_end_slot, buffer_zone_slot = _BOUND_SLOTS
+        tolerance_slot.__set__(self, tolerance)
+        range_start_slot.__set__(self, range_start)
+        range_end_slot.__set__(self, range_end)
+        buffer_zone_slot.__set__(self, buffer_zone)
+        
+        self._critical = tolerance < 0.01 or buffer_zone == 0.0
+        self._safe_tolerance = max(tolerance, 0.01)
+        if range_start is None or range_end is None:
+            self._range_lo_buf = self._range_hi_buf = None
+        else:
+            self._range_lo_buf = range_start - buffer_zone
+            self._range_hi_buf = range_end + buffer_zone
+    
+    def set_bounds(self, tolerance: Optional[float] = None,
+                   range_start: Optional[NumericType] = None,
+                   range_end: Optional[NumericType] = None,
+                   buffer_zone: Optional[float] = None):
+        """
+        Update bound properties and refresh the derived range constants.
+        
+        The new combination is validated before anything is assigned, so
+        an invalid update leaves the anchor unchanged.
+        
+        Args:
+            tolerance: New tolerance (unchanged if None)
+            range_start: New range start (unchanged if None)
+            range_end: New range end (unchanged if None)
+            buffer_zone: New buffer zone (unchanged if None)
+        """
+        if tolerance is None:
+            tolerance = self.tolerance
+        if range_start is None:
+            range_start = self.range_start
+        if range_end is None:
+            range_end = self.range_end
+        if buffer_zone is None:
+            buffer_zone = self.buffer_zone
+        self._replace_bounds(tolerance, range_start, range_end, buffer_zone)
+    
+    def _replace_bounds(self, *bounds):
+        """Validate, store and derive a full (tolerance, range_start, range_end, buffer_zone)."""
+        _check_bounds(*bounds)
+        self._store_bounds(*bounds)
+        self.generation += 1
     
     @property
     def current_value(self) -> Any:
@@ -107,8 +282,8 @@ class Anchor:
         Returns:
             Current value of the anchor
         """
-        if not self.metadata.is_dynamic:
-            return self.value
+        if self._static:
+            return self._cached_value
         
         # Check if cache needs refresh
         if self._should_refresh_cache():
@@ -118,28 +293,35 @@ class Anchor:
     
     def _should_refresh_cache(self) -> bool:
         """Determine if dynamic anchor cache should be refreshed."""
-        if not self.metadata.is_dynamic:
+        metadata = self.metadata
+        if not metadata.is_dynamic:
             return False
         
-        if self._cache_timestamp is None:
-            return True
-        
-        if self.metadata.update_interval is None:
+        interval = metadata.update_interval
+        if interval is None:
             return False  # No automatic refresh
         
-        elapsed = (datetime.now() - self._cache_timestamp).total_seconds()
-        return elapsed >= self.metadata.update_interval
+        return time.monotonic() - self._cache_ts >= interval
     
     def _refresh_cache(self):
         """Refresh cached value for dynamic anchor."""
-        if self.metadata.update_function is not None:
-            try:
-                self._cached_value = self.metadata.update_function()
-                self._cache_timestamp = datetime.now()
-                self.metadata.last_updated = datetime.now()
-            except Exception as e:
-                # Keep old cached value on error
-                print(f"Warning: Failed to update dynamic anchor '{self.name}': {e}")
+        metadata = self.metadata
+        update_function = metadata.update_function
+        if update_function is None:
+            return
+        
+        try:
+            value = update_function()
+        except Exception as e:
+            # Keep old cached value on error
+            _log.warning("Failed to update dynamic anchor '%s': %s", self.name, e)
+            return
+        
+        now = time.monotonic()
+        self._cached_value = value
+        self._cache_ts = now
+        metadata.last_updated = now  # raw stamp, converted when read
+        self.generation += 1
     
     def evaluate(self, context: Optional[Dict] = None) -> Any:
         """
@@ -177,13 +359,9 @@ class Anchor:
             For non-numeric types, returns 0.0 (custom metrics needed)
         """
         current = self.current_value
+        other_value = other.current_value if isinstance(other, Anchor) else other
         
-        if isinstance(other, Anchor):
-            other_value = other.current_value
-        else:
-            other_value = other
-        
-        if isinstance(current, (int, float)) and isinstance(other_value, (int, float)):
+        if isinstance(current, _NUMERIC_TYPES) and isinstance(other_value, _NUMERIC_TYPES):
             return abs(float(current) - float(other_value))
         
         # For non-numeric types, subclasses should override this
@@ -200,11 +378,13 @@ class Anchor:
         Returns:
             True if value is within range, False otherwise
         """
-        if self.range_start is None or self.range_end is None:
+        lo = self._range_lo_buf
+        if lo is None:
             return True  # No range constraint
         
-        buffer = self.buffer_zone if use_buffer else 0.0
-        return (self.range_start - buffer) <= value <= (self.range_end + buffer)
+        if use_buffer:
+            return lo <= value <= self._range_hi_buf
+        return self.range_start <= value <= self.range_end
     
     def is_critical_threshold(self) -> bool:
         """
@@ -216,7 +396,7 @@ class Anchor:
         Returns:
             True if this is a critical threshold
         """
-        return self.tolerance < 0.01 or self.buffer_zone == 0.0
+        return self._critical
     
     def __repr__(self) -> str:
         """String representation for debugging."""
@@ -228,58 +408,186 @@ class Anchor:
         return f"{self.name}: {self.current_value}"
 
 
+def _constructed(anchor: Anchor) -> bool:
+    """False while copy/pickle is still restoring the slots one by one."""
+    return getattr(anchor, "generation", None) is not None
+
+
+def _set_anchor_value(anchor: Anchor, value: Any) -> None:
+    _anchor_value_slot.__set__(anchor, value)
+    if _constructed(anchor):
+        if anchor._static:
+            anchor._cached_value = value
+        anchor.generation += 1
+
+
+def _bound_property(index: int) -> property:
+    """Property over a bound field's slot; assignment re-derives the bounds."""
+    slot = _BOUND_SLOTS[index]
+    
+    def set_bound(anchor: Anchor, value: Any) -> None:
+        if not _constructed(anchor):
+            slot.__set__(anchor, value)  # restored state is already valid
+            return
+        bounds = [bound_slot.__get__(anchor) for bound_slot in _BOUND_SLOTS]
+        bounds[index] = value
+        anchor._replace_bounds(*bounds)
+    
+    return property(slot.__get__, set_bound)
+
+
+_anchor_value_slot = Anchor.value
+_BOUND_FIELDS = ("tolerance", "range_start", "range_end", "buffer_zone")
+_BOUND_SLOTS = tuple(getattr(Anchor, name) for name in _BOUND_FIELDS)
+
+# Reads go straight to the slots. Writes bump the generation, so relations
+# holding a snapshot notice the change, and bound writes are validated and
+# refresh the derived range constants
+Anchor.value = property(_anchor_value_slot.__get__, _set_anchor_value, doc="The reference value.")
+for _index, _name in enumerate(_BOUND_FIELDS):
+    setattr(Anchor, _name, _bound_property(_index))
+del _index, _name
+
+
 class AnchorRegistry:
     """
     Registry for managing anchors in a context.
     
     Provides centralized management of anchors with support for
     dependencies, updates, and queries.
+    
+    Anchors are stored as a structure of arrays: slot ``i`` of every
+    parallel list describes the same anchor, and the dictionary indices
+    map query keys (context, value type) straight to slot numbers so
+    lookups never walk the whole registry.
     """
     
     def __init__(self):
         self._anchors: Dict[str, Anchor] = {}
+        self._anchors_view = MappingProxyType(self._anchors)
         self._dependency_graph: Dict[str, List[str]] = {}
+        
+        # Parallel per-slot arrays
+        self._anchors_list: List[Anchor] = []
+        self._names: List[str] = []
+        self._contexts: List[str] = []
+        self._value_types: List[type] = []
+        self._is_dynamic: List[bool] = []
+        
+        # Query indices (name/context/type -> slots)
+        self._slot_of: Dict[str, int] = {}
+        self._by_context: Dict[str, List[int]] = {}
+        self._by_type: Dict[type, List[int]] = {}  # keyed by exact type(value)
+        self._type_query_cache: Dict[type, Tuple[type, ...]] = {}  # query -> bucket keys
+        self._dynamic_indices: List[int] = []
+        self._dependents_of: Dict[str, List[str]] = {}
     
     def register(self, anchor: Anchor):
         """Register an anchor in the registry."""
-        self._anchors[anchor.name] = anchor
+        name = anchor.name
+        context = anchor.metadata.context
+        value_type = type(anchor.value)
+        is_dynamic = anchor.metadata.is_dynamic
+        
+        idx = self._slot_of.get(name)
+        if idx is None:
+            # New anchor: append a fresh slot
+            idx = len(self._anchors_list)
+            self._slot_of[name] = idx
+            self._anchors_list.append(anchor)
+            self._names.append(name)
+            self._contexts.append(context)
+            self._value_types.append(value_type)
+            self._is_dynamic.append(is_dynamic)
+        else:
+            # Re-registration: reuse the slot and drop its stale index entries
+            self._unindex(idx)
+            self._anchors_list[idx] = anchor
+            self._contexts[idx] = context
+            self._value_types[idx] = value_type
+            self._is_dynamic[idx] = is_dynamic
         
-        # Build dependency graph
+        self._anchors[name] = anchor
+        # insort keeps every index in slot (= registration) order, also when
+        # a re-registered anchor's slot goes back in
+        insort(self._by_context.setdefault(context, []), idx)
+        if value_type not in self._by_type:
+            # A new bucket may satisfy earlier subclass queries
+            self._by_type[value_type] = []
+            self._type_query_cache.clear()
+        insort(self._by_type[value_type], idx)
+        if is_dynamic:
+            insort(self._dynamic_indices, idx)
+        
+        # Build dependency graph (and its inverse for get_dependents, whose
+        # lists hold each dependent once, in slot order)
         if anchor.metadata.dependencies:
-            self._dependency_graph[anchor.name] = anchor.metadata.dependencies
+            self._dependency_graph[name] = anchor.metadata.dependencies
+            slot_of = self._slot_of.__getitem__
+            for dep in dict.fromkeys(anchor.metadata.dependencies):
+                insort(self._dependents_of.setdefault(dep, []), name, key=slot_of)
+    
+    def _unindex(self, idx: int):
+        """Remove slot ``idx`` from every query index."""
+        name = self._names[idx]
+        self._by_context[self._contexts[idx]].remove(idx)
+        self._by_type[self._value_types[idx]].remove(idx)
+        if self._is_dynamic[idx]:
+            self._dynamic_indices.remove(idx)
+        
+        for dep in self._dependency_graph.pop(name, ()):
+            dependents = self._dependents_of.get(dep)
+            if dependents and name in dependents:
+                dependents.remove(name)
     
     def get(self, name: str) -> Optional[Anchor]:
         """Get anchor by name."""
         return self._anchors.get(name)
     
-    def get_all(self) -> Dict[str, Anchor]:
-        """Get all registered anchors."""
-        return self._anchors.copy()
+    def get_all(self) -> Mapping[str, Anchor]:
+        """
+        Get all registered anchors.
+        
+        Returns a live read-only view; use dict(registry.get_all())
+        when a mutable snapshot is needed.
+        """
+        return self._anchors_view
     
     def find_by_context(self, context: str) -> List[Anchor]:
         """Find all anchors in a specific context."""
-        return [
-            anchor for anchor in self._anchors.values()
-            if anchor.metadata.context == context
-        ]
+        anchors = self._anchors_list
+        return [anchors[i] for i in self._by_context.get(context, ())]
     
     def find_by_type(self, value_type: type) -> List[Anchor]:
         """Find all anchors matching a specific value type."""
-        return [
-            anchor for anchor in self._anchors.values()
-            if isinstance(anchor.current_value, value_type)
-        ]
+        bucket_types = self._type_query_cache.get(value_type)
+        if bucket_types is None:
+            bucket_types = tuple(t for t in self._by_type if issubclass(t, value_type))
+            self._type_query_cache[value_type] = bucket_types
+        
+        by_type = self._by_type
+        slots = []
+        for bucket_type in bucket_types:
+            slots.extend(by_type[bucket_type])
+        
+        # Keep registration order across type buckets
+        slots.sort()
+        anchors = self._anchors_list
+        return [anchors[i] for i in slots]
     
     def update_dynamic_anchors(self):
         """Update all dynamic anchors that need refresh."""
-        for anchor in self._anchors.values():
-            if anchor.metadata.is_dynamic and anchor._should_refresh_cache():
+        anchors = self._anchors_list
+        for i in self._dynamic_indices:
+            anchor = anchors[i]
+            if anchor._should_refresh_cache():
                 anchor._refresh_cache()
     
+    def dynamic_names(self) -> List[str]:
+        """Names of all registered dynamic anchors."""
+        names = self._names
+        return [names[i] for i in self._dynamic_indices]
+    
     def get_dependents(self, anchor_name: str) -> List[str]:
         """Get all anchors that depend on the given anchor."""
-        dependents = []
-        for name, deps in self._dependency_graph.items():
-            if anchor_name in deps:
-                dependents.append(name)
-        return dependents
+        return list(self._dependents_of.get(anchor_name, ()))
@@ -4,13 +4,31 @@ Genesis 1:1 - In the beginning...
 
 Manages anchors, relations, and execution context for relational programs.
 """
-from typing import Dict, List, Any, Optional
+import heapq
+from collections import deque
+from typing import Deque, Dict, List, Any, Optional, Set
 from .anchors import Anchor, AnchorRegistry
 from .relations import Relation
 from .types import RelationSignificance, PriorityLevel
 from .exceptions import AnchorNotFoundError, ContextError
 
 
+def _action_priority(action: Dict[str, Any]) -> int:
+    """Sort key for suggested actions (highest priority first)."""
+    return action["priority"].numeric_value
+
+
+# Condition qualifiers mapped to (unbound) Relation predicates
+_QUALIFIER_METHODS = {
+    "over": Relation.is_over,
+    "under": Relation.is_under,
+    "approaching": Relation.is_approaching,
+    "within": Relation.is_within_range,
+    "equal_to": Relation._eq_to,
+    "near": Relation._near_to,
+}
+
+
 class RelationalContext:
     """
     Manages anchors and relationships in execution context.
@@ -25,12 +43,17 @@ class RelationalContext:
         variables: Dictionary of relational variables
         context_stack: Stack for nested contexts (scopes)
         metadata: Context-wide configuration and state
+        anchor_version: Bumped whenever an anchor is (re)registered, so
+            callers can cache anchor lookups and revalidate cheaply
     """
     
     def __init__(self):
         self.anchor_registry = AnchorRegistry()
+        self.anchor_version = 0
         self.variables: Dict[str, Relation] = {}
+        self._anchor_to_vars: Dict[str, Set[str]] = {}  # anchor name -> relation names
         self.context_stack: List[Dict[str, Any]] = []
+        self._current_context_name: Optional[str] = None  # name of top of stack
         self.metadata: Dict[str, Any] = {
             "optimization_goals": {},
             "explanation_mode": True,
@@ -39,9 +62,9 @@ class RelationalContext:
             "auto_suggest_actions": True
         }
         
-        # Execution tracking
-        self._execution_log: List[Dict[str, Any]] = []
-        self._decision_history: List[Dict[str, Any]] = []
+        # Execution tracking (bounded; oldest entries drop off)
+        self._execution_log: Deque[Dict[str, Any]] = deque(maxlen=1000)
+        self._decision_history: Deque[Dict[str, Any]] = deque(maxlen=1000)
     
     def add_anchor(self, anchor: Anchor):
         """
@@ -51,14 +74,14 @@ class RelationalContext:
             anchor: Anchor instance to register
         """
         self.anchor_registry.register(anchor)
-        
-        # Update all existing relations that reference this anchor
-        for var_name, relation in self.variables.items():
-            if anchor.name in relation.anchors:
-                # Update anchor reference and recompute
-                relation.anchors[anchor.name] = anchor
-                relation._compute_distances()
-                relation._invalidate_caches()
+        self.anchor_version += 1
+        
+        # Update existing relations that reference this anchor
+        for var_name in self._anchor_to_vars.get(anchor.name, ()):
+            relation = self.variables[var_name]
+            # Update anchor reference and recompute
+            relation.anchors[anchor.name] = anchor
+            relation.recompute()
     
     def get_anchor(self, name: str) -> Anchor:
         """
@@ -118,8 +141,12 @@ class RelationalContext:
             metadata=metadata or {}
         )
         
-        # Store in context
+        # Store in context (replacing any previous relation of this name)
+        if name in self.variables:
+            self._unindex_relation(name)
         self.variables[name] = relation
+        for anchor_name in anchors:
+            self._anchor_to_vars.setdefault(anchor_name, set()).add(name)
         
         # Log creation
         if self.metadata["explanation_mode"]:
@@ -133,6 +160,13 @@ class RelationalContext:
         
         return relation
     
+    def _unindex_relation(self, name: str):
+        """Drop a relation from the anchor -> relations reverse index."""
+        for anchor_name in self.variables[name].anchors:
+            var_names = self._anchor_to_vars.get(anchor_name)
+            if var_names is not None:
+                var_names.discard(name)
+    
     def update_relation(self, name: str, new_value: Any):
         """
         Update a relational variable's value.
@@ -187,18 +221,17 @@ class RelationalContext:
         Returns:
             List of relevant anchor names
         """
-        relevant = []
-        
         # Type-based matching
-        value_type = type(value)
-        type_matching_anchors = self.anchor_registry.find_by_type(value_type)
-        relevant.extend([a.name for a in type_matching_anchors])
+        relevant = [a.name for a in self.anchor_registry.find_by_type(type(value))]
         
         # Context-based matching (if current context is set)
-        if self.context_stack:
-            current_context = self.context_stack[-1].get("context", "default")
-            context_anchors = self.anchor_registry.find_by_context(current_context)
-            relevant.extend([a.name for a in context_anchors if a.name not in relevant])
+        current_context = self._current_context_name
+        if current_context is not None:
+            seen = set(relevant)
+            for anchor in self.anchor_registry.find_by_context(current_context):
+                if anchor.name not in seen:
+                    seen.add(anchor.name)
+                    relevant.append(anchor.name)
         
         return relevant
     
@@ -217,18 +250,9 @@ class RelationalContext:
         try:
             relation = self.get_relation(relation_name)
             
-            # Map qualifier to method
-            qualifier_map = {
-                "over": relation.is_over,
-                "under": relation.is_under,
-                "approaching": relation.is_approaching,
-                "within": relation.is_within_range,
-                "equal_to": lambda a: relation.qualifier_to(a).name == "EQUAL_TO",
-                "near": lambda a: relation.qualifier_to(a).name == "NEAR",
-            }
-            
-            if qualifier in qualifier_map:
-                result = qualifier_map[qualifier](anchor_name)
+            method = _QUALIFIER_METHODS.get(qualifier)
+            if method is not None:
+                result = method(relation, anchor_name)
                 
                 # Log evaluation
                 if self.metadata["explanation_mode"]:
@@ -254,45 +278,51 @@ class RelationalContext:
                 })
             return False
     
-    def get_suggested_actions(self, relation_name: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_suggested_actions(
+        self,
+        relation_name: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get suggested actions for one or all relations.
         
         Args:
             relation_name: Specific relation to get actions for (or None for all)
+            limit: Optional maximum number of actions to return; only the
+                top ``limit`` actions by priority are kept
             
         Returns:
-            List of suggested action dictionaries
+            List of suggested action dictionaries, highest priority first
         """
-        all_actions = []
-        
         if relation_name:
-            # Get actions for specific relation
-            if relation_name in self.variables:
-                actions = self.variables[relation_name].suggested_actions()
-                for action in actions:
-                    action["relation"] = relation_name
-                all_actions.extend(actions)
+            relation = self.variables.get(relation_name)
+            relations = [(relation_name, relation)] if relation is not None else []
         else:
-            # Get actions for all relations
-            for var_name, relation in self.variables.items():
-                actions = relation.suggested_actions()
-                for action in actions:
-                    action["relation"] = var_name
-                all_actions.extend(actions)
+            relations = self.variables.items()
         
-        # Filter by significance threshold
+        # Resolve the threshold once into the set of significances that pass it
         threshold = self.metadata["significance_threshold"]
-        filtered_actions = [
-            a for a in all_actions
-            if a["significance"] >= threshold
-        ]
+        allowed = {s for s in RelationSignificance if s >= threshold}
         
-        # Sort by priority
-        filtered_actions.sort(key=lambda a: a["priority"].numeric_value, reverse=True)
+        actions = self._iter_suggested_actions(relations, allowed)
         
+        if limit is not None:
+            return heapq.nlargest(limit, actions, key=_action_priority)
+        
+        # Sort by priority
+        filtered_actions = list(actions)
+        filtered_actions.sort(key=_action_priority, reverse=True)
         return filtered_actions
     
+    @staticmethod
+    def _iter_suggested_actions(relations, allowed):
+        """Yield significant actions lazily, tagged with their relation name."""
+        for var_name, relation in relations:
+            for action in relation.suggested_actions():
+                if action["significance"] in allowed:
+                    action["relation"] = var_name
+                    yield action
+    
     def push_context(self, context_name: str, metadata: Optional[Dict] = None):
         """
         Push a new context onto the stack (for scoping).
@@ -306,6 +336,7 @@ class RelationalContext:
             "metadata": metadata or {},
             "variables": set()
         })
+        self._current_context_name = context_name
     
     def pop_context(self):
         """Pop the current context from the stack."""
@@ -313,19 +344,17 @@ class RelationalContext:
             raise ContextError("No context to pop")
         
         context = self.context_stack.pop()
+        self._current_context_name = self.context_stack[-1]["name"] if self.context_stack else None
         
         # Clean up variables from this context if needed
-        # (for now, we keep them in the global namespace)
+        # (for now, we keep them in the global namespace, so the
+        # anchor -> relations index stays valid as-is)
         
         return context
     
     def _log_event(self, event: Dict[str, Any]):
         """Log an execution event for debugging/explanation."""
         self._execution_log.append(event)
-        
-        # Keep log size manageable
-        if len(self._execution_log) > 1000:
-            self._execution_log = self._execution_log[-1000:]
     
     def get_execution_log(self, event_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -339,7 +368,7 @@ class RelationalContext:
         """
         if event_type:
             return [e for e in self._execution_log if e.get("type") == event_type]
-        return self._execution_log.copy()
+        return list(self._execution_log)
     
     def explain_state(self) -> str:
         """
@@ -361,14 +390,14 @@ class RelationalContext:
             for anchor_name in relation.anchors.keys():
                 significance = relation.significance_to(anchor_name)
                 qualifier = relation.qualifier_to(anchor_name)
-                lines.append(f"  → {anchor_name}: {significance.value} ({qualifier.value})")
+                lines.append(f"  → {anchor_name}: {significance.label} ({qualifier.label})")
             
             # Show suggested actions if any
             actions = relation.suggested_actions()
             if actions:
                 lines.append(f"  Suggested actions:")
                 for action in actions[:3]:  # Show top 3
-                    lines.append(f"    - {action['type']} by {action['amount']:.2f} (priority: {action['priority'].value})")
+                    lines.append(f"    - {action['type']} by {action['amount']:.2f} (priority: {action['priority'].label})")
         
         return "\n".join(lines)
     
@@ -376,7 +405,13 @@ class RelationalContext:
         """Update all dynamic anchors and affected relations."""
         self.anchor_registry.update_dynamic_anchors()
         
-        # Recompute all relations
-        for relation in self.variables.values():
-            relation._compute_distances()
-            relation._invalidate_caches()
+        # Only relations tied to a dynamic anchor can have moved; of
+        # those, recompute the ones that saw a new anchor generation
+        affected = set()
+        for name in self.anchor_registry.dynamic_names():
+            affected.update(self._anchor_to_vars.get(name, ()))
+        
+        for var_name in affected:
+            relation = self.variables[var_name]
+            if relation.is_stale():
+                relation.recompute()
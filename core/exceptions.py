@@ -8,39 +8,55 @@ Custom exceptions for relational programming constructs.
 
 class RelationalError(Exception):
     """Base exception for all relational programming errors."""
-    pass
+    __slots__ = ()
 
 
 class AnchorError(RelationalError):
     """Raised when anchor operations fail."""
-    pass
+    __slots__ = ()
 
 
 class AnchorNotFoundError(AnchorError):
     """Raised when referencing a non-existent anchor."""
+    __slots__ = ("anchor_name",)
     
     def __init__(self, anchor_name: str):
         self.anchor_name = anchor_name
-        super().__init__(f"Anchor '{anchor_name}' not found in context")
+        super().__init__(anchor_name)
+    
+    def __str__(self) -> str:
+        return f"Anchor '{self.anchor_name}' not found in context"
 
 
 class InvalidAnchorRangeError(AnchorError):
     """Raised when anchor range is invalid (start > end)."""
+    __slots__ = ("start", "end")
     
     def __init__(self, start: float, end: float):
-        super().__init__(f"Invalid anchor range: {start} > {end}")
+        self.start = start
+        self.end = end
+        super().__init__(start, end)
+    
+    def __str__(self) -> str:
+        return f"Invalid anchor range: {self.start} > {self.end}"
 
 
 class RelationError(RelationalError):
     """Raised when relation operations fail."""
-    pass
+    __slots__ = ()
 
 
 class IncompatibleTypesError(RelationError):
     """Raised when operations involve incompatible types."""
+    __slots__ = ("type1", "type2")
     
     def __init__(self, type1: type, type2: type):
-        super().__init__(f"Incompatible types: {type1.__name__} and {type2.__name__}")
+        self.type1 = type1
+        self.type2 = type2
+        super().__init__(type1, type2)
+    
+    def __str__(self) -> str:
+        return f"Incompatible types: {self.type1.__name__} and {self.type2.__name__}"
 
 
 class ContextError(RelationalError):
@@ -4,14 +4,101 @@ Genesis 1:1 - In the beginning...
 
 Multi-objective optimization for relational decision-making.
 """
-from typing import Dict, List, Any, Optional, Callable
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Callable, Hashable, Sequence, Tuple
 from dataclasses import dataclass
 from .types import OptimizationGoal, PriorityLevel
 from .context import RelationalContext
 from .exceptions import OptimizationError
 
 
-@dataclass
+# Per-unit (energy_impact, cost, safety_improvement) of each action type
+_IMPACT_TABLE = {
+    "reduce": (-0.1, 0.05, 0.3),
+    "increase": (0.15, 0.08, -0.1),
+}
+
+
+def _coerce_priority(priority: Any) -> int:
+    """Numeric priority of an action (NORMAL for anything unrecognized)."""
+    return priority._rank + 1 if type(priority) is PriorityLevel else 2
+
+
+def _dominates_vec(a: Tuple[float, ...], b: Tuple[float, ...]) -> bool:
+    """
+    Dominance kernel on sign-normalized vectors (all maximized).
+    
+    Single pass with early exit on the first worse component.
+    """
+    better_in_any = False
+    for x, y in zip(a, b):
+        if x < y:
+            return False
+        if x > y:
+            better_in_any = True
+    return better_in_any
+
+
+def _pareto_indices(vectors: Sequence[Tuple[float, ...]]) -> List[int]:
+    """
+    Indices of the non-dominated vectors (all objectives maximized).
+    
+    Skyline scan: after sorting lexicographically descending, a vector
+    can only be dominated by one that precedes it, and by transitivity
+    it suffices to test against the frontier kept so far. This costs
+    O(n log n + n * r * m) for a frontier of size r instead of
+    O(n^2 * m) pairwise comparisons.
+    
+    Args:
+        vectors: One objective vector per solution
+        
+    Returns:
+        Indices of Pareto-optimal vectors in ascending order
+    """
+    order = sorted(range(len(vectors)), key=vectors.__getitem__, reverse=True)
+    frontier: List[Tuple[float, ...]] = []
+    front: List[int] = []
+    
+    for i in order:
+        point = vectors[i]
+        dominated = False
+        for f in frontier:
+            if _dominates_vec(f, point):
+                dominated = True
+                break
+        if not dominated:
+            frontier.append(point)
+            front.append(i)
+    
+    front.sort()
+    return front
+
+
+def _crowding_distances(vectors: Sequence[Tuple[float, ...]]) -> List[float]:
+    """
+    NSGA-II crowding distance of each vector within the set.
+    
+    Boundary points per objective get infinity; interior points sum the
+    normalized gap between their neighbours.
+    """
+    n = len(vectors)
+    distances = [0.0] * n
+    if n == 0:
+        return distances
+    for m in range(len(vectors[0])):
+        order = sorted(range(n), key=lambda i: vectors[i][m])
+        lo = vectors[order[0]][m]
+        hi = vectors[order[-1]][m]
+        distances[order[0]] = distances[order[-1]] = float("inf")
+        if hi == lo:
+            continue
+        span = hi - lo
+        for k in range(1, n - 1):
+            distances[order[k]] += (vectors[order[k + 1]][m] - vectors[order[k - 1]][m]) / span
+    return distances
+
+
+@dataclass(slots=True)
 class Objective:
     """
     An optimization objective.
@@ -28,7 +115,7 @@ class Objective:
     evaluator: Optional[Callable[[Dict], float]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Constraint:
     """
     An optimization constraint.
@@ -59,11 +146,44 @@ class OptimizationEngine:
     - Explanation of tradeoffs made
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        cache_size: Optional[int] = 1024,
+        max_archive_size: Optional[int] = None
+    ):
+        """
+        Args:
+            cache_size: Maximum number of cached solution scores, evicted
+                least-recently-used first (None for an unbounded cache)
+            max_archive_size: Maximum Pareto archive size; beyond it the
+                most crowded member is evicted (None keeps the full front)
+        """
         self.objectives: Dict[str, Objective] = {}
         self.constraints: List[Constraint] = []
         self.solutions: List[Dict[str, Any]] = []
-        self._evaluation_cache: Dict[str, float] = {}
+        # Solution key -> (score, names of violated constraints)
+        self._evaluation_cache: "OrderedDict[Hashable, Tuple[float, Tuple[str, ...]]]" = OrderedDict()
+        self.cache_size = cache_size
+        # +1.0 for MAXIMIZE, -1.0 for MINIMIZE, filled by add_objective
+        self._goal_signs: Dict[str, float] = {}
+        # (name, evaluator, signed weight) per objective; weight is negated
+        # for MINIMIZE so every term is a plain add. Rebuilt lazily.
+        self._objective_plan: Optional[List[Tuple[str, Optional[Callable], float]]] = None
+        # Generated scoring function (see _compile_evaluator)
+        self._compiled_eval: Optional[
+            Callable[[Dict[str, Any]], Tuple[float, Tuple[str, ...]]]
+        ] = None
+        
+        # Online Pareto archive over self.solutions, kept as parallel
+        # member/vector lists. It is rebuilt from scratch when objectives
+        # change, when solutions are added behind its back, or when an
+        # outcome cannot be vectorized (mixed objective coverage).
+        self.max_archive_size = max_archive_size
+        self._pareto_archive: List[Dict[str, Any]] = []
+        self._archive_vectors: List[Tuple[float, ...]] = []
+        self._archive_names: Optional[List[str]] = None
+        self._archived_count = 0
+        self._archive_valid = True
     
     def add_objective(
         self, 
@@ -87,9 +207,13 @@ class OptimizationEngine:
             weight=weight,
             evaluator=evaluator
         )
+        self._goal_signs[name] = -1.0 if goal == OptimizationGoal.MINIMIZE else 1.0
+        self._archive_valid = False
         
         # Clear cache when objectives change
         self._evaluation_cache.clear()
+        self._objective_plan = None
+        self._compiled_eval = None
     
     def add_constraint(
         self,
@@ -116,6 +240,7 @@ class OptimizationEngine:
         
         # Clear cache when constraints change
         self._evaluation_cache.clear()
+        self._compiled_eval = None
     
     def evaluate_solution(self, solution: Dict[str, Any]) -> float:
         """
@@ -127,64 +252,147 @@ class OptimizationEngine:
         Returns:
             Overall score (higher is better)
         """
-        # Check cache
-        solution_key = self._solution_key(solution)
-        if solution_key in self._evaluation_cache:
-            return self._evaluation_cache[solution_key]
+        return self._evaluate_entries([solution])[0][0]
+    
+    def evaluate_batch(self, solutions: List[Dict[str, Any]]) -> List[float]:
+        """
+        Evaluate several solutions in one pass.
         
-        score = 0.0
+        The compiled evaluator and cache are resolved once for the
+        whole batch rather than once per solution.
         
-        # Evaluate each objective
-        for obj_name, objective in self.objectives.items():
-            try:
-                if objective.evaluator:
-                    # Use custom evaluator
-                    value = objective.evaluator(solution)
-                elif obj_name in solution:
-                    # Use value from solution directly
-                    value = float(solution[obj_name])
-                else:
-                    # Objective not applicable to this solution
-                    continue
-                
-                weight = objective.weight
-                
-                if objective.goal == OptimizationGoal.MINIMIZE:
-                    # Lower values are better for minimization
-                    # Negate so higher score is still better
-                    score -= value * weight
-                else:  # MAXIMIZE
-                    score += value * weight
-                    
-            except Exception as e:
-                # Log error but continue
-                print(f"Warning: Error evaluating objective {obj_name}: {e}")
-        
-        # Apply constraint penalties
-        for constraint in self.constraints:
-            try:
-                if not constraint.validator(solution):
-                    score -= constraint.penalty
-            except Exception as e:
-                # Treat evaluation error as constraint violation
-                print(f"Warning: Error evaluating constraint {constraint.name}: {e}")
-                score -= constraint.penalty
+        Args:
+            solutions: Solution dictionaries to score
+            
+        Returns:
+            Scores in the same order as ``solutions``
+        """
+        return [score for score, _ in self._evaluate_entries(solutions)]
+    
+    def _evaluate_entries(
+        self,
+        solutions: List[Dict[str, Any]]
+    ) -> List[Tuple[float, Tuple[str, ...]]]:
+        """(score, violated constraint names) per solution, via the cache."""
+        score_fn = self._get_evaluator()
+        solution_key = self._solution_key
+        lookup = self._cache_lookup
+        store = self._cache_store
+        
+        entries = []
+        for solution in solutions:
+            key = solution_key(solution)
+            entry = lookup(key)
+            if entry is None:
+                entry = score_fn(solution)
+                store(key, entry)
+            entries.append(entry)
+        return entries
+    
+    def _cache_lookup(self, key: Hashable) -> Optional[Tuple[float, Tuple[str, ...]]]:
+        """Cached entry for a solution key, marking it recently used."""
+        cache = self._evaluation_cache
+        entry = cache.get(key)
+        if entry is not None:
+            cache.move_to_end(key)
+        return entry
+    
+    def _cache_store(self, key: Hashable, entry: Tuple[float, Tuple[str, ...]]):
+        """Cache an entry, evicting the least recently used past cache_size."""
+        cache = self._evaluation_cache
+        cache[key] = entry
+        if self.cache_size is not None and len(cache) > self.cache_size:
+            cache.popitem(last=False)
+    
+    def _get_objective_plan(self) -> List[Tuple[str, Optional[Callable], float]]:
+        """Flattened (name, evaluator, signed weight) objective terms."""
+        plan = self._objective_plan
+        if plan is None:
+            plan = self._objective_plan = [
+                (
+                    name,
+                    objective.evaluator,
+                    # Lower values are better for minimization;
+                    # the sign keeps higher score better
+                    self._goal_signs[name] * objective.weight,
+                )
+                for name, objective in self.objectives.items()
+            ]
+        return plan
+    
+    def _get_evaluator(self) -> Callable[[Dict[str, Any]], Tuple[float, Tuple[str, ...]]]:
+        """Specialized scoring function, generated on first use."""
+        evaluator = self._compiled_eval
+        if evaluator is None:
+            evaluator = self._compiled_eval = self._compile_evaluator()
+        return evaluator
+    
+    def _compile_evaluator(self) -> Callable[[Dict[str, Any]], Tuple[float, Tuple[str, ...]]]:
+        """
+        Generate a straight-line scoring function for the current setup.
         
-        # Cache result
-        self._evaluation_cache[solution_key] = score
+        Objective/constraint branches are resolved at generation time, so
+        the emitted code is one guarded multiply-add per objective and one
+        check per constraint. Weights, evaluators and names are bound as
+        namespace globals rather than spliced in as literals, and errors
+        are reported exactly as the generic loop used to.
         
-        return score
+        Returns:
+            Function mapping a solution dict to (score, violated names)
+        """
+        ns: Dict[str, Any] = {"_float": float, "_print": print}
+        lines = ["def _eval(sol):", "    s = 0.0", "    bad = []"]
+        
+        # Objectives, in definition order
+        for i, (name, evaluator, signed_weight) in enumerate(self._get_objective_plan()):
+            ns[f"n{i}"] = name
+            ns[f"w{i}"] = signed_weight
+            if evaluator:
+                ns[f"f{i}"] = evaluator
+                pad = "    "
+                term = f"f{i}(sol) * w{i}"
+            else:
+                # Objective only applies when the solution carries it
+                lines.append(f"    if n{i} in sol:")
+                pad = "        "
+                term = f"_float(sol[n{i}]) * w{i}"
+            lines.append(pad + "try:")
+            lines.append(pad + f"    s += {term}")
+            lines.append(pad + "except Exception as e:")
+            lines.append(pad + f'    _print(f"Warning: Error evaluating objective {{n{i}}}: {{e}}")')
+        
+        # Constraint penalties
+        for j, constraint in enumerate(self.constraints):
+            ns[f"v{j}"] = constraint.validator
+            ns[f"p{j}"] = constraint.penalty
+            ns[f"c{j}"] = constraint.name
+            lines.append("    try:")
+            lines.append(f"        if not v{j}(sol):")
+            lines.append(f"            s -= p{j}")
+            lines.append(f"            bad.append(c{j})")
+            lines.append("    except Exception as e:")
+            lines.append(f'        _print(f"Warning: Error evaluating constraint {{c{j}}}: {{e}}")')
+            lines.append(f"        s -= p{j}")
+            lines.append(f"        bad.append(c{j})")
+        
+        lines.append("    return s, tuple(bad)")
+        exec(compile("\n".join(lines), "<optimizer-eval>", "exec"), ns)
+        return ns["_eval"]
     
-    def _solution_key(self, solution: Dict[str, Any]) -> str:
+    def _solution_key(self, solution: Dict[str, Any]) -> Hashable:
         """Generate a cache key for a solution."""
-        # Sort keys for consistent hashing
-        items = sorted(solution.items())
-        return str(items)
+        try:
+            # Order-independent and hashed in C, no string building
+            return frozenset(solution.items())
+        except TypeError:
+            # Unhashable values (lists, dicts): fall back to a repr key
+            return repr(sorted(solution.items(), key=repr))
     
     def find_optimal_action(
         self,
         context: RelationalContext,
-        possible_actions: List[Dict[str, Any]]
+        possible_actions: List[Dict[str, Any]],
+        explain: bool = False
     ) -> Optional[Dict[str, Any]]:
         """
         Find the optimal action given objectives and context.
@@ -192,6 +400,8 @@ class OptimizationEngine:
         Args:
             context: Current relational context
             possible_actions: List of possible action dictionaries
+            explain: Whether to attach a score explanation to the stored
+                solution (otherwise its "explanation" is None)
             
         Returns:
             Optimal action dictionary, or None if no valid actions
@@ -199,36 +409,46 @@ class OptimizationEngine:
         if not possible_actions:
             return None
         
-        scored_actions = []
-        
+        # Simulate every action first so outcomes can be scored as a batch
+        simulated = []
         for action in possible_actions:
             try:
-                # Simulate action outcome
-                simulated_outcome = self._simulate_action(action, context)
-                
-                # Evaluate outcome
-                score = self.evaluate_solution(simulated_outcome)
-                
-                scored_actions.append({
-                    "action": action,
-                    "score": score,
-                    "outcome": simulated_outcome,
-                    "explanation": self._explain_score(simulated_outcome, score)
-                })
+                simulated.append((action, self._simulate_action(action, context)))
             except Exception as e:
                 print(f"Warning: Error evaluating action: {e}")
-                continue
         
-        if not scored_actions:
-            return None
-        
-        # Return action with highest score
-        best = max(scored_actions, key=lambda x: x["score"])
-        
-        # Store for later analysis
-        self.solutions.append(best)
+        entries = self._evaluate_entries([outcome for _, outcome in simulated])
+        scores = [score for score, _ in entries]
+        
+        # Pick the highest score (first wins ties) and explain only that
+        # one; an action whose explanation fails is dropped and the next
+        # best is tried
+        while scores:
+            best_i = max(range(len(scores)), key=scores.__getitem__)
+            action, simulated_outcome = simulated[best_i]
+            score, violated = entries[best_i]
+            explanation = None
+            if explain:
+                try:
+                    explanation = self._explain_score(simulated_outcome, score, violated)
+                except Exception as e:
+                    print(f"Warning: Error evaluating action: {e}")
+                    del simulated[best_i], entries[best_i], scores[best_i]
+                    continue
+            
+            best = {
+                "action": action,
+                "score": score,
+                "outcome": simulated_outcome,
+                "explanation": explanation
+            }
+            
+            # Store for later analysis
+            self._try_archive(best)
+            
+            return action
         
-        return best["action"]
+        return None
     
     def _simulate_action(
         self,
@@ -250,41 +470,45 @@ class OptimizationEngine:
         """
         action_type = action.get("type", "unknown")
         amount = action.get("amount", 0.0)
-        priority = action.get("priority", PriorityLevel.NORMAL)
         
-        # Simple heuristic-based simulation
-        outcome = {
-            "action_type": action_type,
-            "amount": amount,
-            "priority_value": priority.numeric_value if isinstance(priority, PriorityLevel) else 2
-        }
+        priority_value = _coerce_priority(action.get("priority", PriorityLevel.NORMAL))
         
         # Estimate impacts on common objectives
-        if action_type == "reduce":
-            outcome["energy_impact"] = -abs(amount) * 0.1
-            outcome["cost"] = abs(amount) * 0.05
-            outcome["safety_improvement"] = abs(amount) * 0.3
-        elif action_type == "increase":
-            outcome["energy_impact"] = abs(amount) * 0.15
-            outcome["cost"] = abs(amount) * 0.08
-            outcome["safety_improvement"] = -abs(amount) * 0.1
+        impacts = _IMPACT_TABLE.get(action_type)
+        if impacts is None:
+            energy = cost = safety = 0.0
         else:
-            outcome["energy_impact"] = 0.0
-            outcome["cost"] = 0.0
-            outcome["safety_improvement"] = 0.0
+            magnitude = abs(amount)
+            energy = magnitude * impacts[0]
+            cost = magnitude * impacts[1]
+            safety = magnitude * impacts[2]
         
-        # Priority affects how quickly action is taken
-        outcome["response_time"] = 10.0 / outcome["priority_value"]
-        
-        return outcome
+        # Simple heuristic-based simulation
+        return {
+            "action_type": action_type,
+            "amount": amount,
+            "priority_value": priority_value,
+            "energy_impact": energy,
+            "cost": cost,
+            "safety_improvement": safety,
+            # Priority affects how quickly action is taken
+            "response_time": 10.0 / priority_value,
+        }
     
-    def _explain_score(self, outcome: Dict[str, Any], score: float) -> str:
+    def _explain_score(
+        self,
+        outcome: Dict[str, Any],
+        score: float,
+        violated: Optional[Sequence[str]] = None
+    ) -> str:
         """
         Generate explanation of how a score was computed.
         
         Args:
             outcome: Outcome dictionary
             score: Computed score
+            violated: Constraint names already found violated while
+                scoring (re-checked against the validators if None)
             
         Returns:
             Human-readable explanation
@@ -305,10 +529,11 @@ class OptimizationEngine:
                 )
         
         # Check constraint violations
-        violated = []
-        for constraint in self.constraints:
-            if not constraint.validator(outcome):
-                violated.append(constraint.name)
+        if violated is None:
+            violated = [
+                constraint.name for constraint in self.constraints
+                if not constraint.validator(outcome)
+            ]
         
         if violated:
             lines.append(f"  Violated constraints: {', '.join(violated)}")
@@ -368,6 +593,76 @@ class OptimizationEngine:
         if not self.solutions:
             return []
         
+        if not self._archive_valid or self._archived_count != len(self.solutions):
+            self._rebuild_archive()
+        return list(self._pareto_archive)
+    
+    def _try_archive(self, candidate: Dict[str, Any]):
+        """
+        Record a solution and update the Pareto archive incrementally.
+        
+        The candidate is rejected from the archive if a member dominates
+        it; otherwise members it dominates are dropped and it is added.
+        """
+        self.solutions.append(candidate)
+        if not self._archive_valid or self._archived_count != len(self.solutions) - 1:
+            return  # Rebuilt on the next get_pareto_front
+        
+        outcome = candidate["outcome"]
+        names = self._archive_names
+        if names is None:
+            names = self._archive_names = [n for n in self.objectives if n in outcome]
+        point = self._outcome_vector(outcome, names)
+        if point is None:
+            self._archive_valid = False
+            return
+        self._archived_count += 1
+        
+        vectors = self._archive_vectors
+        for member in vectors:
+            if _dominates_vec(member, point):
+                return
+        
+        keep = [i for i, member in enumerate(vectors) if not _dominates_vec(point, member)]
+        if len(keep) != len(vectors):
+            archive = self._pareto_archive
+            self._pareto_archive = [archive[i] for i in keep]
+            self._archive_vectors = vectors = [vectors[i] for i in keep]
+        self._pareto_archive.append(candidate)
+        vectors.append(point)
+        self._evict_crowded()
+    
+    def _rebuild_archive(self):
+        """Recompute the archive from all stored solutions."""
+        self._archived_count = len(self.solutions)
+        vectors = self._objective_vectors()
+        if vectors is None:
+            # Not vectorizable: exact pairwise front, recomputed per call
+            self._pareto_archive = self._pairwise_front()
+            self._archive_vectors = []
+            self._archive_valid = False
+            return
+        
+        front = _pareto_indices(vectors)
+        solutions = self.solutions
+        self._pareto_archive = [solutions[i] for i in front]
+        self._archive_vectors = [vectors[i] for i in front]
+        self._archive_names = [n for n in self.objectives if n in solutions[0]["outcome"]]
+        self._archive_valid = True
+        self._evict_crowded()
+    
+    def _evict_crowded(self):
+        """Drop the most crowded members while over max_archive_size."""
+        limit = self.max_archive_size
+        archive = self._pareto_archive
+        vectors = self._archive_vectors
+        while limit is not None and len(archive) > limit:
+            distances = _crowding_distances(vectors)
+            drop = min(range(len(distances)), key=distances.__getitem__)
+            del archive[drop], vectors[drop]
+    
+    def _pairwise_front(self) -> List[Dict[str, Any]]:
+        """Pareto front by pairwise dominance (any objective coverage)."""
         pareto = []
         
         for candidate in self.solutions:
@@ -387,6 +682,47 @@ class OptimizationEngine:
         
         return pareto
     
+    def _objective_vectors(self) -> Optional[List[Tuple[float, ...]]]:
+        """
+        Sign-normalized objective vectors for all stored solutions.
+        
+        Minimized objectives are negated so dominance becomes "all >=".
+        Returns None when solutions cover different objectives or hold
+        non-numeric/NaN values, where only pairwise comparison is exact.
+        """
+        first = self.solutions[0]["outcome"]
+        names = [name for name in self.objectives if name in first]
+        
+        vectors = []
+        for solution in self.solutions:
+            vector = self._outcome_vector(solution["outcome"], names)
+            if vector is None:
+                return None
+            vectors.append(vector)
+        return vectors
+    
+    def _outcome_vector(
+        self,
+        outcome: Dict[str, Any],
+        names: List[str]
+    ) -> Optional[Tuple[float, ...]]:
+        """
+        Sign-normalized vector of one outcome over ``names``.
+        
+        Returns None if the outcome covers a different objective set or
+        holds a non-numeric/NaN objective value.
+        """
+        if [name for name in self.objectives if name in outcome] != names:
+            return None
+        goal_signs = self._goal_signs
+        row = []
+        for name in names:
+            value = outcome[name]
+            if type(value) not in (int, float) or value != value:
+                return None
+            row.append(goal_signs[name] * value)
+        return tuple(row)
+    
     def _dominates(self, solution_a: Dict, solution_b: Dict) -> bool:
         """
         Check if solution A dominates solution B.
@@ -6,13 +6,33 @@ Relations are values that know their position relative to anchors.
 They carry semantic meaning about what values represent in context.
 """
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
-from .anchors import Anchor
+from operator import is_
+from typing import Any, Dict, List, Optional, Tuple
+from .anchors import (
+    Anchor, _NUMERIC_TYPES, _bulk_distances, _bulk_significance, _significance_code
+)
 from .types import RelationSignificance, PriorityLevel, RelationQualifier, NumericType
 from .exceptions import AnchorNotFoundError, IncompatibleTypesError
 
 
-@dataclass
+# Significance levels indexed by significance code
+_SIGNIFICANCE_LEVELS = (
+    RelationSignificance.NEGLIGIBLE,
+    RelationSignificance.NOTICEABLE,
+    RelationSignificance.SIGNIFICANT,
+    RelationSignificance.CRITICAL,
+    RelationSignificance.EXTREME,
+)
+
+# Priority of the action suggested for each actionable significance
+_PRIORITY_MAP = {
+    RelationSignificance.SIGNIFICANT: PriorityLevel.NORMAL,
+    RelationSignificance.CRITICAL: PriorityLevel.HIGH,
+    RelationSignificance.EXTREME: PriorityLevel.CRITICAL,
+}
+
+
+@dataclass(slots=True)
 class Relation:
     """
     Core relational value that knows its anchors.
@@ -42,8 +62,20 @@ class Relation:
     anchors: Dict[str, Anchor]
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    # Structure-of-arrays layout of the anchors, rebuilt only when an entry
+    # of ``anchors`` is added, removed or replaced
+    _anchor_names: Tuple[str, ...] = field(default=(), init=False, repr=False)
+    _anchor_list: Tuple[Anchor, ...] = field(default=(), init=False, repr=False)
+    _anchor_index: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _anchor_values: List[Any] = field(default_factory=list, init=False, repr=False)
+    _dynamic_slots: Tuple[int, ...] = field(default=(), init=False, repr=False)
+    _static_numeric: bool = field(default=True, init=False, repr=False)
+    _anchor_gens: List[int] = field(default_factory=list, init=False, repr=False)  # at last snapshot
+    
     # Cached computations for performance
-    _distances: Dict[str, float] = field(default_factory=dict, init=False, repr=False)
+    _distance_arr: List[float] = field(default_factory=list, init=False, repr=False)
+    _tolerance_arr: List[float] = field(default_factory=list, init=False, repr=False)  # clamped
+    _numeric_value: Optional[NumericType] = field(default=None, init=False, repr=False)
     _significance_cache: Dict[str, RelationSignificance] = field(
         default_factory=dict, init=False, repr=False
     )
@@ -53,19 +85,86 @@ class Relation:
     
     def __post_init__(self):
         """Initialize relational computations."""
+        self.recompute()
+    
+    def recompute(self):
+        """Recompute distances, drop derived caches and note anchor generations."""
         self._compute_distances()
         self._invalidate_caches()
     
+    def is_stale(self) -> bool:
+        """Check if any anchor changed since the last recompute."""
+        return (not self._layout_current()
+                or [anchor.generation for anchor in self._anchor_list] != self._anchor_gens)
+    
+    def _layout_current(self) -> bool:
+        """Check if the anchor arrays still match ``anchors``."""
+        anchors = self.anchors
+        anchor_list = self._anchor_list
+        return (len(anchors) == len(anchor_list)
+                and tuple(anchors) == self._anchor_names
+                and all(map(is_, anchors.values(), anchor_list)))
+    
+    def _sync_layout(self):
+        """Rebuild the anchor arrays if ``anchors`` changed since the last build."""
+        if self._layout_current():
+            return
+        self._anchor_names = tuple(self.anchors)
+        self._anchor_list = tuple(self.anchors.values())
+        self._anchor_index = {name: i for i, name in enumerate(self._anchor_names)}
+        self._dynamic_slots = tuple(
+            i for i, anchor in enumerate(self._anchor_list) if not anchor._static
+        )
+        self._anchor_gens = []  # forces a fresh value snapshot
+    
+    def _snapshot_values(self, generations: List[int]):
+        """Copy anchor values and tolerances into the layout and note their generations."""
+        self._anchor_values = [anchor.value for anchor in self._anchor_list]
+        self._tolerance_arr = [anchor._safe_tolerance for anchor in self._anchor_list]
+        dynamic = set(self._dynamic_slots)
+        self._static_numeric = all(
+            isinstance(v, _NUMERIC_TYPES)
+            for i, v in enumerate(self._anchor_values) if i not in dynamic
+        )
+        self._anchor_gens = generations
+    
+    def _distance(self, anchor_name: str) -> float:
+        """Cached distance to an anchor."""
+        return self._distance_arr[self._anchor_index[anchor_name]]
+    
     def _compute_distances(self):
         """Compute distances to all anchors."""
-        for name, anchor in self.anchors.items():
-            anchor_value = anchor.current_value
-            
-            if isinstance(self.value, (int, float)) and isinstance(anchor_value, (int, float)):
-                self._distances[name] = abs(float(self.value) - float(anchor_value))
+        self._sync_layout()
+        # Assigning an anchor's value or bounds bumps its generation, so the
+        # snapshot is re-read only when a generation moved; dynamic slots are
+        # re-read below
+        generations = [anchor.generation for anchor in self._anchor_list]
+        if generations != self._anchor_gens:
+            self._snapshot_values(generations)
+        value = self.value
+        self._numeric_value = value if isinstance(value, _NUMERIC_TYPES) else None
+        values = self._anchor_values
+        anchor_list = self._anchor_list
+        all_numeric = self._static_numeric
+        for i in self._dynamic_slots:
+            v = values[i] = anchor_list[i].current_value
+            if not isinstance(v, _NUMERIC_TYPES):
+                all_numeric = False
+        value_is_numeric = self._numeric_value is not None
+        
+        # All-numeric relations are measured in one batched pass
+        if value_is_numeric and all_numeric:
+            self._distance_arr = _bulk_distances(values, value)
+            return
+        
+        distances = []
+        for anchor_value in values:
+            if value_is_numeric and isinstance(anchor_value, _NUMERIC_TYPES):
+                distances.append(abs(float(value) - float(anchor_value)))
             else:
                 # For non-numeric types, use custom distance
-                self._distances[name] = self._compute_custom_distance(anchor_value)
+                distances.append(self._compute_custom_distance(anchor_value))
+        self._distance_arr = distances
     
     def _compute_custom_distance(self, anchor_value: Any) -> float:
         """
@@ -88,8 +187,7 @@ class Relation:
             new_value: New value for this relation
         """
         self.value = new_value
-        self._compute_distances()
-        self._invalidate_caches()
+        self.recompute()
     
     def relation_to(self, anchor_name: str) -> str:
         """
@@ -109,9 +207,9 @@ class Relation:
         
         anchor = self.anchors[anchor_name]
         anchor_value = anchor.current_value
-        distance = self._distances[anchor_name]
+        distance = self._distance(anchor_name)
         
-        if isinstance(self.value, (int, float)) and isinstance(anchor_value, (int, float)):
+        if self._numeric_value is not None and isinstance(anchor_value, _NUMERIC_TYPES):
             if self.value > anchor_value:
                 return f"{distance:.2f} over {anchor_name}"
             elif self.value < anchor_value:
@@ -140,10 +238,10 @@ class Relation:
         
         anchor = self.anchors[anchor_name]
         anchor_value = anchor.current_value
-        distance = self._distances[anchor_name]
+        distance = self._distance(anchor_name)
         
         # Determine qualifier based on distance and tolerance
-        if not isinstance(self.value, (int, float)):
+        if self._numeric_value is None:
             qualifier = RelationQualifier.APPROXIMATELY
         elif distance == 0:
             qualifier = RelationQualifier.EQUAL_TO
@@ -186,26 +284,22 @@ class Relation:
             return RelationSignificance.NEGLIGIBLE
         
         anchor = self.anchors[anchor_name]
-        distance = self._distances[anchor_name]
-        tolerance = max(anchor.tolerance, 0.01)  # Avoid division by zero
+        distance = self._distance(anchor_name)
+        tolerance = anchor._safe_tolerance  # Clamped to avoid division by zero
         
         # Determine significance based on tolerance multiples
-        ratio = distance / tolerance
-        
-        if ratio <= 0.1:
-            significance = RelationSignificance.NEGLIGIBLE
-        elif ratio <= 1.0:
-            significance = RelationSignificance.NOTICEABLE
-        elif ratio <= 2.0:
-            significance = RelationSignificance.SIGNIFICANT
-        elif ratio <= 5.0:
-            significance = RelationSignificance.CRITICAL
-        else:
-            significance = RelationSignificance.EXTREME
+        significance = _SIGNIFICANCE_LEVELS[_significance_code(distance / tolerance)]
         
         self._significance_cache[anchor_name] = significance
         return significance
     
+    def _fill_significance_cache(self):
+        """Classify every anchor in one pass over the distance array."""
+        codes = _bulk_significance(self._distance_arr, self._tolerance_arr)
+        self._significance_cache.update(
+            zip(self._anchor_names, [_SIGNIFICANCE_LEVELS[c] for c in codes])
+        )
+    
     def is_approaching(self, anchor_name: str, threshold: float = 0.8) -> bool:
         """
         Check if value is approaching anchor.
@@ -223,7 +317,7 @@ class Relation:
             return False
         
         anchor = self.anchors[anchor_name]
-        distance = self._distances[anchor_name]
+        distance = self._distance(anchor_name)
         
         return distance <= anchor.tolerance * threshold
     
@@ -235,7 +329,7 @@ class Relation:
         anchor = self.anchors[anchor_name]
         anchor_value = anchor.current_value
         
-        if isinstance(self.value, (int, float)) and isinstance(anchor_value, (int, float)):
+        if self._numeric_value is not None and isinstance(anchor_value, _NUMERIC_TYPES):
             return self.value > anchor_value
         
         return False
@@ -248,7 +342,7 @@ class Relation:
         anchor = self.anchors[anchor_name]
         anchor_value = anchor.current_value
         
-        if isinstance(self.value, (int, float)) and isinstance(anchor_value, (int, float)):
+        if self._numeric_value is not None and isinstance(anchor_value, _NUMERIC_TYPES):
             return self.value < anchor_value
         
         return False
@@ -269,11 +363,19 @@ class Relation:
         
         anchor = self.anchors[anchor_name]
         
-        if isinstance(self.value, (int, float)):
+        if self._numeric_value is not None:
             return anchor.is_within_range(self.value, use_buffer)
         
         return False
     
+    def _eq_to(self, anchor_name: str) -> bool:
+        """Check if the qualifier to an anchor is EQUAL_TO."""
+        return self.qualifier_to(anchor_name) is RelationQualifier.EQUAL_TO
+    
+    def _near_to(self, anchor_name: str) -> bool:
+        """Check if the qualifier to an anchor is NEAR."""
+        return self.qualifier_to(anchor_name) is RelationQualifier.NEAR
+    
     def suggested_actions(self) -> List[Dict[str, Any]]:
         """
         Generate suggested actions based on all anchor relationships.
@@ -284,53 +386,64 @@ class Relation:
         Returns:
             List of action dictionaries with type, target, amount, priority, reason
         """
-        actions = []
-        
-        for anchor_name, anchor in self.anchors.items():
+        # Only numeric values can be over/under an anchor
+        value = self.value
+        if self._numeric_value is None:
+            return []
+        
+        # Actions are bucketed by priority (SIGNIFICANT and above only
+        # map to NORMAL/HIGH/CRITICAL), so no sort is needed
+        critical, high, normal = [], [], []
+        buckets = {
+            PriorityLevel.CRITICAL: critical,
+            PriorityLevel.HIGH: high,
+            PriorityLevel.NORMAL: normal,
+        }
+        
+        if len(self._significance_cache) < len(self._anchor_names):
+            self._fill_significance_cache()
+        
+        # Single pass over the anchor arrays; each anchor is read once
+        for anchor_name, anchor, distance in zip(
+            self._anchor_names, self._anchor_list, self._distance_arr
+        ):
             significance = self.significance_to(anchor_name)
             
             # Only suggest actions for significant deviations
             if significance < RelationSignificance.SIGNIFICANT:
                 continue
             
-            relation = self.relation_to(anchor_name)
-            distance = self._distances[anchor_name]
+            anchor_value = anchor.current_value
+            if not isinstance(anchor_value, _NUMERIC_TYPES):
+                continue
             
             # Determine action type and priority
-            if self.is_over(anchor_name):
+            if value > anchor_value:
                 action_type = "reduce"
                 direction = "over"
-            elif self.is_under(anchor_name):
+            elif value < anchor_value:
                 action_type = "increase"
                 direction = "under"
             else:
                 continue
             
             # Map significance to priority
-            priority_map = {
-                RelationSignificance.SIGNIFICANT: PriorityLevel.NORMAL,
-                RelationSignificance.CRITICAL: PriorityLevel.HIGH,
-                RelationSignificance.EXTREME: PriorityLevel.CRITICAL
-            }
-            
-            priority = priority_map.get(significance, PriorityLevel.NORMAL)
+            priority = _PRIORITY_MAP.get(significance, PriorityLevel.NORMAL)
             
             action = {
                 "type": action_type,
                 "target": anchor_name,
                 "amount": distance,
                 "priority": priority,
-                "reason": f"Value is {relation}",
+                "reason": f"Value is {distance:.2f} {direction} {anchor_name}",
                 "significance": significance,
                 "qualifier": self.qualifier_to(anchor_name)
             }
             
-            actions.append(action)
-        
-        # Sort by priority (highest first)
-        actions.sort(key=lambda a: a["priority"].numeric_value, reverse=True)
+            buckets[priority].append(action)
         
-        return actions
+        # Highest priority first, insertion order within a priority
+        return critical + high + normal
     
     def get_expression(self) -> str:
         """
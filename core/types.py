@@ -13,7 +13,46 @@ T = TypeVar('T')
 NumericType = Union[int, float]
 
 
-class RelationSignificance(Enum):
+class _RankedEnum(Enum):
+    """
+    Enum whose members order by definition position.
+    
+    Each member stores its position as ``_rank`` when it is created, so the
+    comparisons below are plain int compares. Values stay the lowercase
+    strings, and members of different ranked enums never compare equal.
+    """
+    
+    def __init__(self, *args):
+        # Members are added to _member_map_ after __init__ runs
+        self._rank = len(type(self)._member_map_)
+    
+    @property
+    def label(self) -> str:
+        """Lowercase display name (e.g. "critical")."""
+        return self._value_
+    
+    def __lt__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._rank < other._rank
+    
+    def __le__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._rank <= other._rank
+    
+    def __gt__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._rank > other._rank
+    
+    def __ge__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._rank >= other._rank
+
+
+class RelationSignificance(_RankedEnum):
     """
     Significance levels for relational changes.
     
@@ -29,32 +68,9 @@ class RelationSignificance(Enum):
     SIGNIFICANT = "significant"
     CRITICAL = "critical"
     EXTREME = "extreme"
-    
-    def __lt__(self, other):
-        """Allow comparison of significance levels."""
-        if not isinstance(other, RelationSignificance):
-            return NotImplemented
-        
-        order = [
-            RelationSignificance.NEGLIGIBLE,
-            RelationSignificance.NOTICEABLE,
-            RelationSignificance.SIGNIFICANT,
-            RelationSignificance.CRITICAL,
-            RelationSignificance.EXTREME
-        ]
-        return order.index(self) < order.index(other)
-    
-    def __le__(self, other):
-        return self == other or self < other
-    
-    def __gt__(self, other):
-        return not self <= other
-    
-    def __ge__(self, other):
-        return not self < other
 
 
-class PriorityLevel(Enum):
+class PriorityLevel(_RankedEnum):
     """
     Priority levels for actions and decisions.
     
@@ -69,29 +85,10 @@ class PriorityLevel(Enum):
     @property
     def numeric_value(self) -> int:
         """Get numeric representation for sorting."""
-        return {
-            PriorityLevel.LOW: 1,
-            PriorityLevel.NORMAL: 2,
-            PriorityLevel.HIGH: 3,
-            PriorityLevel.CRITICAL: 4
-        }[self]
-    
-    def __lt__(self, other):
-        if not isinstance(other, PriorityLevel):
-            return NotImplemented
-        return self.numeric_value < other.numeric_value
-    
-    def __le__(self, other):
-        return self == other or self < other
-    
-    def __gt__(self, other):
-        return not self <= other
-    
-    def __ge__(self, other):
-        return not self < other
+        return self._rank + 1
 
 
-class RelationQualifier(Enum):
+class RelationQualifier(_RankedEnum):
     """
     Qualifiers for relational comparisons.
     
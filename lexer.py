@@ -1,21 +1,267 @@
 """Lexer: Tokenizes source code into a stream of tokens."""
 
 import re
-from typing import List, Optional
+from itertools import chain
+from typing import Dict, FrozenSet, Iterator, List, Optional
 from tokens import Token, Keyword, Identifier, Integer, String, Operator, Boolean
 from syntax_loader import SyntaxLoader
 
 
+# Scanners for the token classes. \s and \w follow str.isspace() and
+# str.isalnum() exactly, so they agree with the character methods.
+_COMMENT_RE = re.compile(r'\*sidegist[^\n]*\n?|\*omo\*(?:.*?\*omo\*|.*)', re.DOTALL)
+_STRING_RE = re.compile(r'"([^"]*)"?')
+_DIGITS_RE = re.compile(r'[0-9.]*')
+_WORD_RE = re.compile(r'\w*')
+_SPACE_RE = re.compile(r'\s*')
+
+# YorubaNumeralSystem multi-word operators: first word -> allowed second words
+_YNS_MULTI_WORD = {
+    'relative': ['to'],  # "relative to"
+    'bouncing': ['from'],  # "bouncing from"
+    'away': ['from'],  # "away from"
+    'trending': ['toward', 'upward', 'downward'],  # "trending toward", etc.
+}
+
+_YNS_OPERATORS = {
+    'relative to': 'relative_to',
+    'bouncing from': 'bouncing_from',
+    'away from': 'away_from',
+    'trending toward': 'trending_toward',
+    'trending upward': 'trending_upward',
+    'trending downward': 'trending_downward',
+}
+
+# Words after '@' that are always keywords, even if the syntax omits them
+_RELATIONAL_KEYWORDS = frozenset({
+    'anchor', 'variable', 'when', 'function', 'struct',
+    'optimize', 'action', 'explain', 'explanation',
+    'priority', 'duration', 'data',
+})
+
+_BOOLEAN_LITERALS = frozenset({'true', 'false'})
+
+
+def _starts_word(char: str) -> bool:
+    return char.isalpha() or char == '_'
+
+
+def _match_operator_words(text: str, first_word: str, pos: int, operators,
+                          multi_word: Dict[str, FrozenSet[str]]) -> Optional[tuple]:
+    """
+    Match a (possibly multi-word) operator whose first word ends at ``pos``.
+    
+    ``multi_word`` is SyntaxLoader.multi_word_operators; a word that starts
+    no multi-word operator is settled without looking past it.
+    
+    Returns:
+        (operator_string, end position) or None if the word is not an operator
+    """
+    n = len(text)
+    
+    followers = _YNS_MULTI_WORD.get(first_word)
+    if followers is not None:
+        pos = _SPACE_RE.match(text, pos).end()
+        if pos < n and _starts_word(text[pos]):
+            second_end = _WORD_RE.match(text, pos).end()
+            second_word = text[pos:second_end]
+            if second_word in followers:
+                combined = f"{first_word} {second_word}"
+                return (_YNS_OPERATORS.get(combined, combined), second_end)
+            pos = second_end
+    
+    if first_word not in multi_word:
+        return (first_word, pos) if first_word in operators else None
+    
+    pos = _SPACE_RE.match(text, pos).end()
+    
+    # Try known two-word operators first
+    if pos < n and _starts_word(text[pos]):
+        second_end = _WORD_RE.match(text, pos).end()
+        two_word = first_word + ' ' + text[pos:second_end]
+        if two_word in operators:
+            return (two_word, second_end)
+        
+        # The three-word probe restarts at the second word, so its "third"
+        # word is the second one again
+        three_word = two_word + ' ' + text[pos:second_end]
+        if three_word in operators:
+            return (three_word, second_end)
+    
+    # Try single-word operator
+    if first_word in operators:
+        return (first_word, pos)
+    return None
+
+
+# ============================================================================
+# FIRST-CHARACTER DISPATCH
+# ============================================================================
+# tokenize looks up the handler for each token's first character in
+# _DISPATCH (ASCII) and calls it with (lexer, text, pos); the handler
+# appends any token and returns the position after it.
+
+def _lex_whitespace(lexer, text, pos):
+    return _SPACE_RE.match(text, pos).end()
+
+
+def _lex_string(lexer, text, pos):
+    m = _STRING_RE.match(text, pos)
+    lexer.tokens.append(String(m.group(1)))
+    return m.end()
+
+
+def _scan_number(text: str, pos: int) -> int:
+    """End of the run of digits and dots starting at ``pos``"""
+    end = _DIGITS_RE.match(text, pos).end()
+    # Only non-ASCII digits get past the regex
+    while end < len(text) and (text[end].isdigit() or text[end] == '.'):
+        end += 1
+    return end
+
+
+def _lex_number(lexer, text, pos):
+    end = _scan_number(text, pos)
+    lexer.tokens.append(Integer(text[pos:end]))
+    return end
+
+
+def _lex_dot(lexer, text, pos):
+    if pos + 1 < len(text) and text[pos + 1].isdigit():
+        return _lex_number(lexer, text, pos)
+    return _lex_operator(lexer, text, pos)
+
+
+def _lex_word(lexer, text, pos):
+    end = _WORD_RE.match(text, pos).end()
+    ident = text[pos:end]
+    
+    # Try to match multi-word operators first
+    if ident in lexer._operator_starts:
+        operator = _match_operator_words(text, ident, end, lexer._operators, lexer._multi_word)
+        if operator is not None:
+            lexer.tokens.append(Operator(operator[0]))
+            return operator[1]
+    
+    # Otherwise, treat as keyword or identifier
+    if ident in lexer._keywords:
+        lexer.tokens.append(Keyword(ident))
+    elif ident in _BOOLEAN_LITERALS:
+        lexer.tokens.append(Boolean(ident))
+    else:
+        lexer.tokens.append(Identifier(ident))
+    return end
+
+
+def _lex_at(lexer, text, pos):
+    # @ symbol (relational variable marker)
+    lexer.pos = pos
+    lexer.current_char = '@'
+    lexer.handle_at_symbol()
+    return lexer.pos
+
+
+def _lex_star(lexer, text, pos):
+    m = _COMMENT_RE.match(text, pos)
+    if m:
+        return m.end()
+    return _lex_operator(lexer, text, pos)
+
+
+def _lex_operator(lexer, text, pos):
+    # Shortest punctuation operator that prefixes the text wins
+    symbols = lexer._symbol_operators
+    for length in lexer._symbol_lengths:
+        candidate = text[pos:pos + length]
+        if candidate in symbols:
+            lexer.tokens.append(Operator(candidate))
+            return pos + length
+    # No operator: report the whole run of punctuation
+    n = len(text)
+    start = pos
+    while pos < n and not text[pos].isalnum() and not text[pos].isspace():
+        pos += 1
+    if pos > start:
+        raise ValueError(f"Invalid operator: {text[start:pos]}")
+    return pos
+
+
+def _lex_unicode(lexer, text, pos):
+    # Non-ASCII first character: classify with the str methods
+    char = text[pos]
+    if char.isspace():
+        return _lex_whitespace(lexer, text, pos)
+    if char.isdigit():
+        return _lex_number(lexer, text, pos)
+    if char.isalpha():
+        return _lex_word(lexer, text, pos)
+    return _lex_operator(lexer, text, pos)
+
+
+def _build_dispatch() -> List:
+    table = [_lex_operator] * 128
+    for code in range(128):
+        char = chr(code)
+        if char.isspace():
+            table[code] = _lex_whitespace
+        elif char.isdigit():
+            table[code] = _lex_number
+        elif char.isalpha() or char == '_':
+            table[code] = _lex_word
+    table[ord('"')] = _lex_string
+    table[ord('.')] = _lex_dot
+    table[ord('@')] = _lex_at
+    table[ord('*')] = _lex_star
+    return table
+
+
+_DISPATCH = _build_dispatch()
+
+
+def _code_points(text: str):
+    """
+    Indexable code points of ``text``, one int per character.
+    
+    ASCII source (the usual case) is encoded to bytes, whose items are
+    already ints; anything else goes through a native-order UTF-32 buffer.
+    Either way the conversion runs in C, so the token loop indexes ints
+    instead of calling ord() on a fresh one-character string.
+    """
+    if text.isascii():
+        return text.encode('ascii')
+    # 'utf-32' writes a BOM in native byte order first
+    return memoryview(text.encode('utf-32', 'surrogatepass'))[4:].cast('I')
+
+
 class Lexer:
     """Tokenizer for GIANT Language source code."""
     
-    def __init__(self, text: str, syntax_loader: SyntaxLoader) -> None:
+    def __init__(self, text: str, syntax_loader: SyntaxLoader, stream: bool = False) -> None:
+        """
+        Args:
+            text: Source code to tokenize
+            syntax_loader: Configured syntax loader instance
+            stream: Leave tokenizing to iter_tokens() instead of filling
+                self.tokens up front
+        """
         self.text = text
         self.syntax = syntax_loader
+        # Bound once rather than looked up through the loader per token
+        self._keywords = syntax_loader.keywords
+        self._at_keywords = _RELATIONAL_KEYWORDS | syntax_loader.keywords
+        self._operators = syntax_loader.operators
+        self._multi_word = syntax_loader.multi_word_operators
+        # Words that can begin some operator; any other word is settled
+        # without calling _match_operator_words
+        self._operator_starts = frozenset(_YNS_MULTI_WORD).union(
+            self._multi_word, self._operators)
+        self._symbol_operators = syntax_loader.symbol_operators
+        self._symbol_lengths = syntax_loader.symbol_operator_lengths
         self.tokens: List[Token] = []
         self.pos = 0
         self.current_char: Optional[str] = self.text[0] if self.text else None
-        self.tokenize()
+        if not stream:
+            self.tokenize()
 
     def advance(self) -> None:
         """Move to next character in source code."""
@@ -32,56 +278,49 @@ class Lexer:
             return None
         return self.text[peek_pos]
 
+    def _seek(self, pos: int) -> None:
+        """Jump to ``pos`` (clamped to the end) and refresh current_char."""
+        text = self.text
+        if pos >= len(text):
+            self.pos = len(text)
+            self.current_char = None
+        else:
+            self.pos = pos
+            self.current_char = text[pos]
+
     def skip_whitespace(self) -> None:
         """Skip whitespace characters."""
-        while self.current_char and self.current_char.isspace():
-            self.advance()
+        if self.current_char:
+            self._seek(_SPACE_RE.match(self.text, self.pos).end())
     
     def skip_single_line_comment(self) -> None:
         """Skip single-line comment starting with *sidegist."""
         # Already verified we're at *sidegist, skip the rest of the line
-        while self.current_char and self.current_char != '\n':
-            self.advance()
-        if self.current_char == '\n':
-            self.advance()  # Skip the newline
+        # including the newline
+        newline = self.text.find('\n', self.pos)
+        self._seek(len(self.text) if newline < 0 else newline + 1)
     
     def skip_multi_line_comment(self) -> None:
         """Skip multi-line comment between *omo* ... *omo*."""
-        # Skip opening *omo*
-        for _ in range(5):  # Length of "*omo*"
-            self.advance()
-        
-        # Look for closing *omo*
-        while self.current_char:
-            if self.current_char == '*' and self.peek_word(5) == '*omo*':
-                # Skip closing *omo*
-                for _ in range(5):
-                    self.advance()
-                return
-            self.advance()
+        # Look for the closing *omo* after the opening one
+        end = self.text.find('*omo*', self.pos + 5)
+        self._seek(len(self.text) if end < 0 else end + 5)
     
     def peek_word(self, length: int) -> str:
         """Peek ahead to get a word of specific length."""
-        result = ''
-        for i in range(length):
-            char = self.peek(i) if i == 0 else self.text[self.pos + i] if self.pos + i < len(self.text) else None
-            if i == 0:
-                char = self.current_char
-            if char:
-                result += char
-            else:
-                break
-        return result
+        if self.current_char is None:
+            return ''
+        return self.text[self.pos:self.pos + length]
     
     def check_for_comments(self) -> bool:
         """Check if current position starts a comment and skip it if so."""
         # Check for *sidegist (single-line comment)
-        if self.current_char == '*' and self.peek_word(9) == '*sidegist':
+        if self.current_char == '*' and self.text.startswith('*sidegist', self.pos):
             self.skip_single_line_comment()
             return True
         
         # Check for *omo* (multi-line comment)
-        if self.current_char == '*' and self.peek_word(5) == '*omo*':
+        if self.current_char == '*' and self.text.startswith('*omo*', self.pos):
             self.skip_multi_line_comment()
             return True
         
@@ -89,28 +328,30 @@ class Lexer:
 
     def read_identifier(self) -> str:
         """Read alphanumeric identifier or keyword."""
-        result = ''
-        while self.current_char and (self.current_char.isalnum() or self.current_char == '_'):
-            result += self.current_char
-            self.advance()
-        return result
+        start = self.pos
+        if self.current_char is None:
+            return ''
+        end = _WORD_RE.match(self.text, start).end()
+        self._seek(end)
+        return self.text[start:end]
 
     def read_string(self) -> str:
         """Read string literal enclosed in double quotes."""
-        result = ''
-        self.advance()  # skip opening quote
-        while self.current_char and self.current_char != '"':
-            result += self.current_char
-            self.advance()
-        self.advance()  # skip closing quote
-        return result
+        start = self.pos + 1  # skip opening quote
+        end = self.text.find('"', start)
+        if end < 0:
+            end = len(self.text)
+        self._seek(end + 1)  # skip closing quote
+        return self.text[start:end]
 
     def read_number(self) -> str:
-        result = ''
-        while self.current_char and (self.current_char.isdigit() or self.current_char == '.'):
-            result += self.current_char
-            self.advance()
-        return result
+        """Read a run of digits and dots."""
+        start = self.pos
+        if self.current_char is None:
+            return ''
+        end = _scan_number(self.text, start)
+        self._seek(end)
+        return self.text[start:end]
     
     def handle_at_symbol(self):
         """
@@ -135,13 +376,7 @@ class Lexer:
             ident = self.read_identifier()
             
             # Check if it's a known relational keyword
-            relational_keywords = [
-                'anchor', 'variable', 'when', 'function', 'struct', 
-                'optimize', 'action', 'explain', 'explanation', 
-                'priority', 'duration', 'data'
-            ]
-            
-            if ident in relational_keywords or self.syntax.is_keyword(ident):
+            if ident in self._at_keywords:
                 self.tokens.append(Keyword(ident))
             else:
                 self.tokens.append(Identifier(ident))
@@ -155,142 +390,60 @@ class Lexer:
         Returns:
             (operator_string, matched) or (None, False)
         """
-        # For simplicity and correctness, check known multi-word operators
-        # instead of greedily reading ahead
-        
-        saved_pos = self.pos
-        saved_char = self.current_char
-        
-        # Get first word
-        if not self.current_char or not (self.current_char.isalpha() or self.current_char == '_'):
+        if not self.current_char or not _starts_word(self.current_char):
             return (None, False)
         
-        first_word = self.read_identifier()
-        if not first_word:
+        end = _WORD_RE.match(self.text, self.pos).end()
+        match = _match_operator_words(self.text, self.text[self.pos:end], end,
+                                      self._operators, self._multi_word)
+        if match is None:
             return (None, False)
         
-        # Check for YorubaNumeralSystem multi-word operators first
-        yns_multi_word = {
-            'relative': ['to'],  # "relative to"
-            'bouncing': ['from'],  # "bouncing from"
-            'away': ['from'],  # "away from"
-            'trending': ['toward', 'upward', 'downward'],  # "trending toward", etc.
-        }
-        
-        if first_word in yns_multi_word:
-            # Skip whitespace
-            while self.current_char and self.current_char.isspace():
-                self.advance()
-            
-            # Try to match second word
-            if self.current_char and (self.current_char.isalpha() or self.current_char == '_'):
-                second_word = self.read_identifier()
-                
-                if second_word in yns_multi_word[first_word]:
-                    combined = f"{first_word} {second_word}"
-                    # Map to operator value
-                    operator_map = {
-                        'relative to': 'relative_to',
-                        'bouncing from': 'bouncing_from',
-                        'away from': 'away_from',
-                        'trending toward': 'trending_toward',
-                        'trending upward': 'trending_upward',
-                        'trending downward': 'trending_downward',
-                    }
-                    return (operator_map.get(combined, combined), True)
-        
-        # Skip whitespace
-        while self.current_char and self.current_char.isspace():
-            self.advance()
-        
-        # Try known two-word operators first
-        if self.current_char and (self.current_char.isalpha() or self.current_char == '_'):
-            second_word_start = self.pos
-            second_word = self.read_identifier()
-            two_word = first_word + ' ' + second_word
-            
-            if two_word in self.syntax.operators:
-                return (two_word, True)
-            
-            # Restore to after first word
-            self.pos = second_word_start
-            self.current_char = self.text[self.pos] if self.pos < len(self.text) else None
-            
-            # Skip whitespace again
-            while self.current_char and self.current_char.isspace():
-                self.advance()
-            
-            # Try three-word operators
-            if self.current_char and (self.current_char.isalpha() or self.current_char == '_'):
-                third_word_start = self.pos
-                third_word = self.read_identifier()
-                three_word = first_word + ' ' + second_word + ' ' + third_word
-                
-                if three_word in self.syntax.operators:
-                    return (three_word, True)
-                
-                # Restore to after first word for single-word check
-                self.pos = second_word_start
-                self.current_char = self.text[self.pos] if self.pos < len(self.text) else None
-        
-        # Try single-word operator
-        if first_word in self.syntax.operators:
-            return (first_word, True)
-        
-        # No match - restore completely
-        self.pos = saved_pos
-        self.current_char = saved_char
-        return (None, False)
+        self.pos = match[1]
+        self.current_char = self.text[self.pos] if self.pos < len(self.text) else None
+        return (match[0], True)
 
     def tokenize(self):
-        while self.current_char:
-            # Check for comments first
-            if self.check_for_comments():
-                continue
-            
-            if self.current_char.isspace():
-                self.skip_whitespace()
-                continue
-            if self.current_char == '"':
-                self.tokens.append(String(self.read_string()))
-                continue
-            if self.current_char.isdigit() or (self.current_char == '.' and self.peek() and self.peek().isdigit()):
-                self.tokens.append(Integer(self.read_number()))
-                continue
-            if self.current_char.isalpha() or self.current_char == '_':
-                # Try to match multi-word operators first
-                operator, matched = self.try_match_multi_word_operator()
-                if matched:
-                    self.tokens.append(Operator(operator))
-                    continue
-                
-                # Otherwise, treat as keyword or identifier
-                ident = self.read_identifier()
-                if self.syntax.is_keyword(ident):
-                    self.tokens.append(Keyword(ident))
-                elif ident in ['true', 'false']:
-                    self.tokens.append(Boolean(ident))
-                else:
-                    self.tokens.append(Identifier(ident))
-                continue
-            
-            # Check for @ symbol first (relational variable marker)
-            if self.current_char == '@':
-                self.handle_at_symbol()
-                continue
-            
-            # Check for operators (multi-char first)
-            op = ''
-            found = False
-            while self.current_char and not self.current_char.isalnum() and not self.current_char.isspace():
-                op += self.current_char
-                if op in self.syntax.operators:
-                    self.tokens.append(Operator(op))
-                    self.advance()
-                    found = True
-                    break
-                self.advance()
-            
-            if not found and op:
-                raise ValueError(f"Invalid operator: {op}")
+        """Scan the whole source into self.tokens."""
+        for _ in self._scan(None):
+            pass
         return self.tokens
+
+    def iter_tokens(self, batch_size: int = 64) -> Iterator[Token]:
+        """Scan the source lazily, yielding tokens as they are recognised."""
+        return chain.from_iterable(self._scan(batch_size))
+
+    def _scan(self, batch_size: Optional[int]) -> Iterator[List[Token]]:
+        """
+        Scan the source, yielding self.tokens each time it holds at least
+        batch_size tokens (and once at the end); each yielded list is then
+        replaced by a fresh one. With batch_size None the whole stream is
+        one batch left in self.tokens.
+        
+        Each token's first character selects its handler from the
+        _DISPATCH table in one indexed lookup; the handler consumes the
+        token with a compiled regex where it can.
+        """
+        text = self.text
+        n = len(text)
+        codes = _code_points(text)
+        dispatch = _DISPATCH
+        lex_whitespace = _lex_whitespace
+        skip_space = _SPACE_RE.match
+        pos = self.pos
+        
+        while pos < n:
+            code = codes[pos]
+            handler = dispatch[code] if code < 128 else _lex_unicode
+            if handler is lex_whitespace:
+                # The most frequent "token"; skipped without a call
+                pos = skip_space(text, pos).end()
+            else:
+                pos = handler(self, text, pos)
+                if batch_size is not None and len(self.tokens) >= batch_size:
+                    yield self.tokens
+                    self.tokens = []
+        
+        self.pos = pos
+        self.current_char = None
+        yield self.tokens
@@ -1,22 +1,44 @@
 """GIANT Language REPL: Interactive programming environment."""
 
 import sys
+from functools import cache, lru_cache
 from syntax_loader import SyntaxLoader
 from lexer import Lexer
 from parser import Parser
 from interpreter import Interpreter
 
 
+@cache
+def _get_syntax() -> SyntaxLoader:
+    """Shared SyntaxLoader, built on first use."""
+    return SyntaxLoader()
+
+
+@cache
+def _get_parser() -> Parser:
+    """Shared Parser; parse() resets its state for every token list."""
+    return Parser(_get_syntax())
+
+
+@lru_cache(maxsize=256)
+def _lex_cached(line: str, syntax_loader: SyntaxLoader) -> tuple:
+    """Tokenize a REPL line, memoized per (line, syntax) pair."""
+    return tuple(Lexer(line, syntax_loader).tokens)
+
+
+def _lex(line: str, syntax_loader: SyntaxLoader) -> list:
+    """Return a fresh token list for line, reusing earlier lexes of it."""
+    return list(_lex_cached(line, syntax_loader))
+
+
 def run_file(filename: str) -> None:
     """Execute a .naija file."""
     try:
         with open(filename, 'r', encoding='utf-8') as f:
             code = f.read()
         
-        syntax_loader = SyntaxLoader()
-        lexer = Lexer(code, syntax_loader)
-        parser = Parser(syntax_loader)
-        ast = parser.parse(lexer.tokens)
+        lexer = Lexer(code, _get_syntax(), stream=True)
+        ast = _get_parser().parse(lexer.iter_tokens())
         interpreter = Interpreter()
         interpreter.interpret(ast)
     except FileNotFoundError:
@@ -29,8 +51,8 @@ def run_file(filename: str) -> None:
 
 def run_repl() -> None:
     """Run interactive Read-Eval-Print Loop for GIANT Language."""
-    syntax_loader = SyntaxLoader()
-    parser = Parser(syntax_loader)
+    syntax_loader = _get_syntax()
+    parser = _get_parser()
     interpreter = Interpreter()
 
     print("Welcome to Naija Pidgin Programming Language REPL! Type 'stop' to quit.")
@@ -43,7 +65,7 @@ def run_repl() -> None:
             if not line:  # Skip empty lines
                 continue
             
-            tokens = Lexer(line, syntax_loader).tokens
+            tokens = _lex(line, syntax_loader)
             ast = parser.parse(tokens)
             interpreter.interpret(ast)
         except KeyboardInterrupt:
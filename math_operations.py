@@ -3,6 +3,47 @@
 Supports equivalent operations in Pidgin, English, and mixed usage.
 """
 
+import operator
+from functools import lru_cache
+from typing import Callable, Dict
+
+
+class _OperationError(ArithmeticError):
+    """Raised by a table operation; the message is shown to the user."""
+
+
+# Operations on already-converted floats, keyed by canonical operator.
+# plus/minus/times are the C functions from the operator module; the rest
+# raise _OperationError for inputs they reject.
+
+def _divided_by(a: float, b: float) -> float:
+    if b == 0:
+        raise _OperationError("Wahala! Person no dey divide by zero, dat one go break things!")
+    return a / b
+
+
+def _power(a: float, b: float) -> float:
+    # float ** float raises OverflowError instead of returning inf, so an
+    # isinf() check cannot replace this; the try itself is free when nothing
+    # is raised.
+    try:
+        return a ** b
+    except OverflowError:
+        raise _OperationError("Wahala! Dat power too big, e no fit compute am!") from None
+
+
+def _sqrt(a: float) -> float:
+    if a < 0:
+        raise _OperationError("Wahala! No negative numbers for square root, abeg!")
+    return a ** 0.5
+
+
+def _cbrt(a: float) -> float:
+    # Cube root works for negative numbers
+    if a < 0:
+        return -(-a) ** (1/3)
+    return a ** (1/3)
+
 
 class MathOperations:
     """
@@ -64,6 +105,36 @@ class MathOperations:
         'root': 'nroot',
     }
 
+    # OPERATION TABLES
+    # Canonical operator -> implementation on float operands
+    BINARY_OPERATIONS = {
+        'plus': operator.add,
+        'minus': operator.sub,
+        'times': operator.mul,
+        'divided_by': _divided_by,
+        'power': _power,
+    }
+
+    UNARY_OPERATIONS = {
+        'sqrt': _sqrt,
+        'cbrt': _cbrt,
+    }
+
+    # Operator phrase -> resolved handler, filled by binary_handler
+    _binary_handlers: Dict[str, Callable] = {}
+
+    # OPERATOR EXPLANATIONS
+    # Canonical operator -> description shown by explain_operator
+    OPERATOR_EXPLANATIONS = {
+        'plus': 'Addition: combining two quantities together',
+        'minus': 'Subtraction: finding the difference between two quantities',
+        'times': 'Multiplication: repeated addition of a quantity',
+        'divided_by': 'Division: splitting a quantity into equal parts',
+        'power': 'Exponentiation: repeated multiplication of a quantity by itself',
+        'sqrt': 'Square root: finding the quantity that when multiplied by itself gives the original',
+        'cbrt': 'Cube root: finding the quantity that when multiplied by itself three times gives the original',
+    }
+
     # STROUD-STYLE FORMAL DECLARATIONS
     FORMAL_KEYWORDS = {
         'let': 'let',
@@ -73,7 +144,11 @@ class MathOperations:
         'equals': 'eq',
     }
 
+    # The phrase-keyed helpers below are memoized: the set of phrases a
+    # program uses is tiny, and the maps are not modified at run time.
+
     @staticmethod
+    @lru_cache(maxsize=256)
     def normalize_operator(operator_phrase: str) -> tuple[str, bool]:
         """
         Normalize any English or Pidgin operator phrase to canonical internal form.
@@ -113,35 +188,51 @@ class MathOperations:
             Returns (result, None) on success
             Returns (None, error_message) on failure
         """
-        try:
-            operand1 = float(operand1)
-            operand2 = float(operand2)
-        except (TypeError, ValueError):
-            return (None, f"Wahala! Numbers must be proper numbers, not '{operand1}' and '{operand2}'")
+        return MathOperations.binary_handler(operator)(operand1, operand2)
+
+    @staticmethod
+    def binary_handler(operator: str) -> Callable[[float | int, float | int], tuple[float | int | None, str | None]]:
+        """
+        Resolve an operator phrase to a function of its two operands.
+        
+        The phrase is normalized once per distinct spelling, so callers
+        that keep the handler (e.g. on the BinOp node) skip the string
+        normalization and operator switch on every evaluation.
+        
+        Args:
+            operator: Operator phrase (will be normalized internally)
+            
+        Returns:
+            Function taking (operand1, operand2) and returning the same
+            (result, error_message) tuple as evaluate_operation
+        """
+        handler = MathOperations._binary_handlers.get(operator)
+        if handler is not None:
+            return handler
 
-        # Normalize the operator first
         canonical_op, is_valid = MathOperations.normalize_operator(operator)
-        if not is_valid:
-            return (None, f"Wahala! I no know dis operator: {operator}")
+        operation = MathOperations.BINARY_OPERATIONS.get(canonical_op)
+        if operation is None:
+            unknown = operator if not is_valid else canonical_op
+            error = f"Wahala! I no know dis operator: {unknown}"
 
-        if canonical_op == 'plus':
-            return (operand1 + operand2, None)
-        elif canonical_op == 'minus':
-            return (operand1 - operand2, None)
-        elif canonical_op == 'times':
-            return (operand1 * operand2, None)
-        elif canonical_op == 'divided_by':
-            if operand2 == 0:
-                return (None, "Wahala! Person no dey divide by zero, dat one go break things!")
-            return (operand1 / operand2, None)
-        elif canonical_op == 'power':
+        def handler(operand1, operand2):
+            # Values produced by earlier arithmetic are already floats
+            if type(operand1) is not float or type(operand2) is not float:
+                try:
+                    operand1 = float(operand1)
+                    operand2 = float(operand2)
+                except (TypeError, ValueError):
+                    return (None, f"Wahala! Numbers must be proper numbers, not '{operand1}' and '{operand2}'")
+            if operation is None:
+                return (None, error)
             try:
-                result = operand1 ** operand2
-                return (result, None)
-            except OverflowError:
-                return (None, "Wahala! Dat power too big, e no fit compute am!")
-        else:
-            return (None, f"Wahala! I no know dis operator: {canonical_op}")
+                return (operation(operand1, operand2), None)
+            except _OperationError as e:
+                return (None, str(e))
+
+        MathOperations._binary_handlers[operator] = handler
+        return handler
 
 
     @staticmethod
@@ -157,32 +248,28 @@ class MathOperations:
         Returns:
             Tuple of (result, error_message)
         """
-        try:
-            operand = float(operand)
-        except (TypeError, ValueError):
-            return (None, f"Wahala! '{operand}' no be proper number!")
+        if type(operand) is not float:
+            try:
+                operand = float(operand)
+            except (TypeError, ValueError):
+                return (None, f"Wahala! '{operand}' no be proper number!")
 
         # Normalize the operator first
         canonical_op, is_valid = MathOperations.normalize_operator(operator)
         if not is_valid:
             return (None, f"Wahala! I no know dis operator: {operator}")
 
-        if canonical_op == 'sqrt':
-            if operand < 0:
-                return (None, "Wahala! No negative numbers for square root, abeg!")
-            return (operand ** 0.5, None)
-        elif canonical_op == 'cbrt':
-            # Cube root works for negative numbers
-            if operand < 0:
-                result = -(-operand) ** (1/3)
-            else:
-                result = operand ** (1/3)
-            return (result, None)
-        else:
+        operation = MathOperations.UNARY_OPERATIONS.get(canonical_op)
+        if operation is None:
             return (None, f"Wahala! I no know dis operator: {canonical_op}")
+        try:
+            return (operation(operand), None)
+        except _OperationError as e:
+            return (None, str(e))
 
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def is_formal_declaration(keyword: str) -> tuple[bool, str]:
         """
         Check if a keyword is a formal mathematical declaration.
@@ -195,9 +282,9 @@ class MathOperations:
         Returns:
             Tuple of (is_formal, normalized_keyword)
         """
-        normalized = keyword.strip().lower()
-        if normalized in MathOperations.FORMAL_KEYWORDS:
-            return (True, MathOperations.FORMAL_KEYWORDS[normalized])
+        formal = MathOperations.FORMAL_KEYWORDS.get(keyword.strip().lower())
+        if formal is not None:
+            return (True, formal)
         return (False, "")
 
     @staticmethod
@@ -213,9 +300,10 @@ class MathOperations:
         Returns:
             List of all synonyms for that operator
         """
-        return [k for k, v in MathOperations.OPERATOR_MAP.items() if v == canonical_op]
+        return list(_SYNONYMS_BY_CANONICAL.get(canonical_op, ()))
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def explain_operator(operator_phrase: str) -> str:
         """
         Explain what an operator does in Stroud's mathematical language.
@@ -231,14 +319,11 @@ class MathOperations:
         if not is_valid:
             return f"I no know '{operator_phrase}', abeg try 'help operations'"
         
-        explanations = {
-            'plus': 'Addition: combining two quantities together',
-            'minus': 'Subtraction: finding the difference between two quantities',
-            'times': 'Multiplication: repeated addition of a quantity',
-            'divided_by': 'Division: splitting a quantity into equal parts',
-            'power': 'Exponentiation: repeated multiplication of a quantity by itself',
-            'sqrt': 'Square root: finding the quantity that when multiplied by itself gives the original',
-            'cbrt': 'Cube root: finding the quantity that when multiplied by itself three times gives the original',
-        }
-        
-        return explanations.get(canonical, f"Operation: {canonical}")
+        return MathOperations.OPERATOR_EXPLANATIONS.get(canonical, f"Operation: {canonical}")
+
+
+# Canonical operator -> its synonyms in OPERATOR_MAP order
+_SYNONYMS_BY_CANONICAL: Dict[str, tuple[str, ...]] = {}
+for _phrase, _canonical in MathOperations.OPERATOR_MAP.items():
+    _SYNONYMS_BY_CANONICAL[_canonical] = _SYNONYMS_BY_CANONICAL.get(_canonical, ()) + (_phrase,)
+del _phrase, _canonical
@@ -3,9 +3,12 @@
 Handles Pidgin English syntax + YorubaNumeralSystem relational programming.
 """
 
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
 
-from tokens import Token, Keyword, Identifier, Integer, String, Operator, Boolean
+from tokens import (
+    Token, Keyword, Identifier, Operator,
+    KIND_KEYWORD, KIND_OPERATOR, KIND_IDENTIFIER, KIND_INTEGER, KIND_STRING, KIND_BOOLEAN
+)
 from relational.ast_nodes import (
     AnchorDeclaration, RelationalVariable, WhenStatement, OptimizationDirective,
     AnchorType, AnchorProperty, RelativeToClause, RelationalExpression,
@@ -16,6 +19,34 @@ from relational.ast_nodes import (
 from syntax_loader import SyntaxLoader
 from math_operations import MathOperations
 
+
+def _phrases_for(*canonical: str) -> frozenset:
+    """Every operator phrase that normalizes to one of the canonical names."""
+    return frozenset(
+        phrase for phrase, name in MathOperations.OPERATOR_MAP.items() if name in canonical
+    )
+
+
+# Operator phrases by precedence level, so the precedence loops test
+# membership instead of normalizing each operator token
+_ADDITIVE_OPS = _phrases_for('plus', 'minus')
+_MULTIPLICATIVE_OPS = _phrases_for('times', 'divided_by')
+_POWER_OPS = _phrases_for('power', 'sqrt', 'cbrt')
+
+# Keywords that end a relational variable's property list by starting the
+# next statement
+_STATEMENT_START_KEYWORDS = frozenset({
+    'talk', 'relational', 'when', 'list', 'describe',
+    'anchor', 'suppose', 'den', 'make', 'repeat', 'stop',
+})
+
+# Relational operators that take a threshold expression
+_THRESHOLD_OPERATORS = frozenset({'approaches', 'enters', 'leaves', 'crosses'})
+
+# Separators accepted between a simple-style anchor's name and value
+_ANCHOR_ASSIGN_OPS = frozenset({'=', 'na'})
+
+
 class Parser:
     """
     Recursive descent parser for GIANT Language (Nigerian Pidgin + YorubaNumeralSystem).
@@ -35,104 +66,114 @@ class Parser:
             syntax_loader: Configured syntax loader instance
         """
         self.syntax = syntax_loader
-        self.tokens: list[Token] = []
-        self.current: int = 0
+        # The grammar needs at most one token of lookahead, so only the
+        # current token and the one after it are held; None past the end
+        self._cur: Optional[Token] = None
+        self._next: Optional[Token] = None
+        # Source of the tokens after self._next
+        self._stream: Optional[Iterator[Token]] = None
+        # Statement parsers keyed by the lowercased leading keyword
+        self._stmt_handlers: dict[str, Callable] = {
+            'list': self._parse_list_statement,
+            'describe': self._parse_describe_statement,
+            'inspect': self._parse_describe_statement,
+            'show': self._parse_show_statement,
+            'when': self.parse_when_statement,
+            'relational': self.parse_relational_variable,
+            'let': self.parse_formal_declaration,
+            'make': self.parse_make_assignment,
+            'set': self.parse_set_assignment,
+            'talk': self.parse_output,
+            'wetin': self.parse_output,
+        }
 
-    def parse(self, tokens: list[Token]) -> Block:
-        """Parse a list of tokens and return AST.
+    def parse(self, tokens: Iterable[Token]) -> Block:
+        """Parse tokens and return AST.
         
         Args:
-            tokens: List of tokens from lexer
+            tokens: List of tokens from lexer, or an iterator such as
+                Lexer.iter_tokens(); an iterator is consumed only as far as
+                lookahead requires, so lexing and parsing interleave and
+                consumed tokens are not retained
             
         Returns:
             Block node containing all statements
         """
-        self.tokens = tokens
-        self.current = 0
-        return self.parse_program()
+        stream = self._stream = iter(tokens)
+        self._cur = next(stream, None)
+        self._next = next(stream, None)
+        try:
+            return self.parse_program()
+        finally:
+            # Don't keep the source alive between parses
+            self._stream = self._cur = self._next = None
 
     def parse_program(self):
         """program: statement*"""
         statements = []
-        while not self.is_at_end():
-            stmt = self.parse_statement()
+        append = statements.append
+        parse_statement = self.parse_statement
+        while self._cur is not None:
+            stmt = parse_statement()
             if stmt:
-                statements.append(stmt)
+                append(stmt)
         return Block(statements)
 
     def parse_statement(self):
         """Parse a single statement"""
-        token = self.peek()
+        token = self._cur
         
         # Check for relational syntax first
-        if token and isinstance(token, Operator) and token.value == '@':
+        if token and token.kind == KIND_OPERATOR and token.value == '@':
             # Peek ahead to determine which type
-            saved_pos = self.current
-            self.advance()  # Skip @
-            next_token = self.peek()
-            self.current = saved_pos  # Restore position
+            next_token = self._peek1()
             
-            if next_token and isinstance(next_token, Keyword):
-                kw = next_token.value.lower()
+            if next_token and next_token.kind == KIND_KEYWORD:
+                kw = next_token.value_lc
                 if kw == 'anchor':
                     return self.parse_anchor_declaration()
                 elif kw == 'optimize':
                     return self.parse_optimization_directive()
         
         # Check for keyword-based statements
-        if token and isinstance(token, Keyword):
-            keyword_val = token.value.lower()
-            
-            # Check for anchor management commands
-            if keyword_val == 'list':
-                # Check for "list anchors"
-                next_token = self.peek_ahead(1)
-                if next_token and isinstance(next_token, Keyword) and next_token.value.lower() in ['anchor', 'anchors']:
-                    return self.parse_list_anchors()
-            
-            if keyword_val in ['describe', 'inspect']:
-                # Check for "describe anchor NAME"
-                next_token = self.peek_ahead(1)
-                if next_token and isinstance(next_token, Keyword) and next_token.value.lower() == 'anchor':
-                    return self.parse_describe_anchor()
-            
-            if keyword_val == 'show':
-                # Could be "show anchor NAME" or regular "show var"
-                next_token = self.peek_ahead(1)
-                if next_token and isinstance(next_token, Keyword) and next_token.value.lower() == 'anchor':
-                    return self.parse_describe_anchor()
-                # Otherwise fall through to output parsing
-            
-            # Check for relational keywords
-            if keyword_val == 'when':
-                return self.parse_when_statement()
-            
-            if keyword_val == 'relational':
-                return self.parse_relational_variable()
-            
-            # Check for formal declarations (let x be...)
-            if keyword_val == 'let':
-                return self.parse_formal_declaration()
-            
-            # Check for make assignments (make x be...)
-            if keyword_val == 'make':
-                return self.parse_make_assignment()
-            
-            # Check for set assignments (set x to...)
-            if keyword_val == 'set':
-                return self.parse_set_assignment()
-            
-            # Check for output statements (talk, show, wetin)
-            if keyword_val in ['talk', 'show', 'wetin']:
-                return self.parse_output()
+        if token and token.kind == KIND_KEYWORD:
+            handler = self._stmt_handlers.get(token.value_lc)
+            if handler is not None:
+                return handler()
         
-        # Try to parse as expression
+        return self._parse_expression_statement()
+
+    def _parse_expression_statement(self):
+        """Parse a statement that is a bare expression"""
         expr = self.parse_expression()
         if expr:
             return expr
         
         return None
 
+    def _next_is_keyword(self, *values):
+        """Check whether the token after the current one is one of the keywords"""
+        next_token = self._peek1()
+        return bool(next_token and next_token.kind == KIND_KEYWORD and next_token.value_lc in values)
+
+    def _parse_list_statement(self):
+        """list anchors, or an expression starting with 'list'"""
+        if self._next_is_keyword('anchor', 'anchors'):
+            return self.parse_list_anchors()
+        return self._parse_expression_statement()
+
+    def _parse_describe_statement(self):
+        """describe/inspect anchor NAME, or an expression"""
+        if self._next_is_keyword('anchor'):
+            return self.parse_describe_anchor()
+        return self._parse_expression_statement()
+
+    def _parse_show_statement(self):
+        """show anchor NAME, or the 'show var' output statement"""
+        if self._next_is_keyword('anchor'):
+            return self.parse_describe_anchor()
+        return self.parse_output()
+
     def parse_formal_declaration(self):
         """
         Parse formal declaration: 
@@ -143,19 +184,19 @@ class Parser:
         var_name = self.consume(Identifier, "Expected variable name").value
         
         # Consume 'be' keyword
-        be_token = self.peek()
-        if isinstance(be_token, Keyword) and be_token.value.lower() == 'be':
+        be_token = self._cur
+        if be_token is not None and be_token.kind == KIND_KEYWORD and be_token.value_lc == 'be':
             self.advance()
         else:
             raise SyntaxError("Expected 'be' in formal declaration")
         
         # Check for optional 'equal to'
-        next_token = self.peek()
-        if next_token and ((isinstance(next_token, Keyword) or isinstance(next_token, Operator)) and 
-            next_token.value.lower() == 'equal'):
+        next_token = self._cur
+        if next_token and (next_token.kind in (KIND_KEYWORD, KIND_OPERATOR) and 
+            next_token.value_lc == 'equal'):
             self.advance()  # consume 'equal'
-            if (self.peek() and isinstance(self.peek(), Keyword) and 
-                self.peek().value.lower() == 'to'):
+            to_token = self._cur
+            if to_token and to_token.kind == KIND_KEYWORD and to_token.value_lc == 'to':
                 self.advance()  # consume 'to'
         
         # Now parse the expression
@@ -167,8 +208,8 @@ class Parser:
         self.consume(Keyword, "Expected 'make'")
         var_name = self.consume(Identifier, "Expected variable name").value
         
-        be_token = self.peek()
-        if be_token and isinstance(be_token, Keyword) and be_token.value.lower() == 'be':
+        be_token = self._cur
+        if be_token and be_token.kind == KIND_KEYWORD and be_token.value_lc == 'be':
             self.advance()
         else:
             raise SyntaxError("Expected 'be' after variable name in 'make' statement")
@@ -181,8 +222,8 @@ class Parser:
         self.consume(Keyword, "Expected 'set'")
         var_name = self.consume(Identifier, "Expected variable name").value
         
-        to_token = self.peek()
-        if to_token and isinstance(to_token, Keyword) and to_token.value.lower() == 'to':
+        to_token = self._cur
+        if to_token and to_token.kind == KIND_KEYWORD and to_token.value_lc == 'to':
             self.advance()
         else:
             raise SyntaxError("Expected 'to' after variable name in 'set' statement")
@@ -192,9 +233,9 @@ class Parser:
 
     def parse_output(self):
         """Parse output statements: talk expr, show var, wetin be var"""
-        token = self.peek()
-        if isinstance(token, Keyword):
-            keyword = token.value.lower()
+        token = self._cur
+        if token is not None and token.kind == KIND_KEYWORD:
+            keyword = token.value_lc
             self.advance()
             
             if keyword == 'talk':
@@ -205,7 +246,8 @@ class Parser:
                 return Print(Var(var_token.value))
             elif keyword == 'wetin':
                 # wetin be var?
-                if self.peek() and isinstance(self.peek(), Keyword) and self.peek().value.lower() == 'be':
+                be_token = self._cur
+                if be_token and be_token.kind == KIND_KEYWORD and be_token.value_lc == 'be':
                     self.advance()
                 var_token = self.consume(Identifier, "Expected variable name")
                 return Print(Var(var_token.value))
@@ -220,18 +262,17 @@ class Parser:
         """Parse addition/subtraction (lowest precedence)"""
         expr = self.parse_multiplicative()
         
-        while self.peek() and isinstance(self.peek(), Operator):
-            op_token = self.peek()
-            op_str = op_token.value.lower()
-            canonical, valid = MathOperations.normalize_operator(op_str)
-            
+        op_token = self._cur
+        while op_token is not None and op_token.kind == KIND_OPERATOR:
+            op_str = op_token.value_lc
             # Check if it's an additive operator
-            if canonical in ['plus', 'minus']:
+            if op_str in _ADDITIVE_OPS:
                 self.advance()
                 right = self.parse_multiplicative()
                 expr = BinOp(expr, op_str, right)
             else:
                 break
+            op_token = self._cur
         
         return expr
 
@@ -239,18 +280,17 @@ class Parser:
         """Parse multiplication/division (medium precedence)"""
         expr = self.parse_power()
         
-        while self.peek() and isinstance(self.peek(), Operator):
-            op_token = self.peek()
-            op_str = op_token.value.lower()
-            canonical, valid = MathOperations.normalize_operator(op_str)
-            
+        op_token = self._cur
+        while op_token is not None and op_token.kind == KIND_OPERATOR:
+            op_str = op_token.value_lc
             # Check if it's a multiplicative operator
-            if canonical in ['times', 'divided_by']:
+            if op_str in _MULTIPLICATIVE_OPS:
                 self.advance()
                 right = self.parse_power()
                 expr = BinOp(expr, op_str, right)
             else:
                 break
+            op_token = self._cur
         
         return expr
 
@@ -258,31 +298,31 @@ class Parser:
         """Parse power operations (high precedence)"""
         expr = self.parse_unary()
         
-        if self.peek() and isinstance(self.peek(), Operator):
-            op_token = self.peek()
-            op_str = op_token.value.lower()
-            canonical, valid = MathOperations.normalize_operator(op_str)
-            
-            if canonical in ['power', 'sqrt', 'cbrt']:
-                self.advance()
-                right = self.parse_unary()
-                expr = BinOp(expr, op_str, right)
+        # Single check on the common path: most primaries are not followed
+        # by a power operator
+        op_token = self._cur
+        if (op_token is not None and op_token.kind == KIND_OPERATOR
+                and op_token.value_lc in _POWER_OPS):
+            self.advance()
+            right = self.parse_unary()
+            return BinOp(expr, op_token.value_lc, right)
         
         return expr
 
     def parse_unary(self):
         """Parse unary operations: square root of x, cube root of x"""
-        token = self.peek()
+        token = self._cur
         
         # Check for multi-word operators like "square root of" (lexed as single operator)
-        if token and isinstance(token, Operator):
-            op_value = token.value.lower()
+        if token and token.kind == KIND_OPERATOR:
+            op_value = token.value_lc
             
             # Check if it's "square root" operator
             if op_value == 'square root':
                 self.advance()
                 # Check for "of" keyword
-                if self.peek() and isinstance(self.peek(), Operator) and self.peek().value.lower() == 'of':
+                of_token = self._cur
+                if of_token and of_token.kind == KIND_OPERATOR and of_token.value_lc == 'of':
                     self.advance()
                 operand = self.parse_primary()
                 return UnaryOp('sqrt', operand)
@@ -291,7 +331,8 @@ class Parser:
             elif op_value == 'cube root':
                 self.advance()
                 # Check for "of" keyword
-                if self.peek() and isinstance(self.peek(), Operator) and self.peek().value.lower() == 'of':
+                of_token = self._cur
+                if of_token and of_token.kind == KIND_OPERATOR and of_token.value_lc == 'of':
                     self.advance()
                 operand = self.parse_primary()
                 return UnaryOp('cbrt', operand)
@@ -300,28 +341,29 @@ class Parser:
 
     def parse_primary(self):
         """Parse primary values: numbers, strings, variables, parenthesized expressions"""
-        token = self.peek()
+        token = self._cur
         
         if not token:
             raise SyntaxError("Unexpected end of input")
+        kind = token.kind
         
         # Numbers
-        if isinstance(token, Integer):
+        if kind == KIND_INTEGER:
             self.advance()
             return Num(token.value)
         
         # Strings
-        if isinstance(token, String):
+        if kind == KIND_STRING:
             self.advance()
             return Str(token.value)
         
         # Booleans
-        if isinstance(token, Boolean):
+        if kind == KIND_BOOLEAN:
             self.advance()
             return Bool(token.value.lower() == 'true')
         
         # Variables
-        if isinstance(token, Identifier):
+        if kind == KIND_IDENTIFIER:
             self.advance()
             return Var(token.value)
         
@@ -339,20 +381,20 @@ class Parser:
         2. YorubaNumeralSystem style: @anchor(name="name", value=100, property1=val1)
         """
         # Consume @ operator
-        at_token = self.peek()
-        if not (isinstance(at_token, Operator) and at_token.value == '@'):
+        at_token = self._cur
+        if not (at_token is not None and at_token.kind == KIND_OPERATOR and at_token.value == '@'):
             raise SyntaxError("Expected '@' for anchor declaration")
         self.advance()
         
         # Consume 'anchor' keyword
-        anchor_token = self.peek()
-        if not (isinstance(anchor_token, Keyword) and anchor_token.value.lower() == 'anchor'):
+        anchor_token = self._cur
+        if not (anchor_token is not None and anchor_token.kind == KIND_KEYWORD and anchor_token.value_lc == 'anchor'):
             raise SyntaxError("Expected 'anchor' keyword after '@'")
         self.advance()
         
         # Check for YorubaNumeralSystem style (parentheses) vs simple style
-        next_token = self.peek()
-        if isinstance(next_token, Operator) and next_token.value == '(':
+        next_token = self._cur
+        if next_token is not None and next_token.kind == KIND_OPERATOR and next_token.value == '(':
             return self._parse_anchor_yns_style()
         else:
             return self._parse_anchor_simple_style()
@@ -364,8 +406,8 @@ class Parser:
         name = name_token.value
         
         # Consume '='
-        eq_token = self.peek()
-        if not (isinstance(eq_token, Operator) and eq_token.value in ['=', 'na']):
+        eq_token = self._cur
+        if not (eq_token is not None and eq_token.kind == KIND_OPERATOR and eq_token.value in _ANCHOR_ASSIGN_OPS):
             raise SyntaxError("Expected '=' after anchor name")
         self.advance()
         
@@ -373,33 +415,22 @@ class Parser:
         value = self.parse_expression()
         
         # Convert to literals
-        if isinstance(value, Num):
-            value = NumberLiteral(value=value.value)
-        elif isinstance(value, Str):
-            value = StringLiteral(value=value.value)
-        elif isinstance(value, Bool):
-            value = BooleanLiteral(value=value.value)
+        value = self._to_literal(value)
         
         # Parse optional properties
         properties = []
-        while (self.peek() and isinstance(self.peek(), Identifier) and 
-               not isinstance(self.peek(), Keyword)):
+        while self._cur and self._cur.kind == KIND_IDENTIFIER:
             prop_name = self.consume(Identifier, "Expected property name").value
             
-            eq = self.peek()
-            if not (isinstance(eq, Operator) and eq.value == '='):
+            eq = self._cur
+            if not (eq is not None and eq.kind == KIND_OPERATOR and eq.value == '='):
                 break
             self.advance()
             
             prop_value = self.parse_expression()
             
             # Convert to literals
-            if isinstance(prop_value, Num):
-                prop_value = NumberLiteral(value=prop_value.value)
-            elif isinstance(prop_value, Str):
-                prop_value = StringLiteral(value=prop_value.value)
-            elif isinstance(prop_value, Bool):
-                prop_value = BooleanLiteral(value=prop_value.value)
+            prop_value = self._to_literal(prop_value)
             
             properties.append(AnchorProperty(key=prop_name, value=prop_value))
         
@@ -420,7 +451,8 @@ class Parser:
         value = None
         properties = []
         
-        while self.peek() and not (isinstance(self.peek(), Operator) and self.peek().value == ')'):
+        token = self._cur
+        while token and not (token.kind == KIND_OPERATOR and token.value == ')'):
             # Parse property name
             prop_name_token = self.consume(Identifier, "Expected property name")
             prop_name = prop_name_token.value
@@ -432,12 +464,7 @@ class Parser:
             prop_value = self.parse_expression()
             
             # Convert to literals
-            if isinstance(prop_value, Num):
-                prop_value = NumberLiteral(value=prop_value.value)
-            elif isinstance(prop_value, Str):
-                prop_value = StringLiteral(value=prop_value.value)
-            elif isinstance(prop_value, Bool):
-                prop_value = BooleanLiteral(value=prop_value.value)
+            prop_value = self._to_literal(prop_value)
             
             # Special handling for name and value parameters
             if prop_name == "name":
@@ -454,8 +481,10 @@ class Parser:
                 properties.append(AnchorProperty(key=prop_name, value=prop_value))
             
             # Check for comma
-            if self.peek() and isinstance(self.peek(), Operator) and self.peek().value == ',':
+            comma = self._cur
+            if comma and comma.kind == KIND_OPERATOR and comma.value == ',':
                 self.advance()
+            token = self._cur
         
         # Consume closing parenthesis
         self.consume(Operator, "Expected ')' to close YorubaNumeralSystem anchor")
@@ -472,6 +501,17 @@ class Parser:
             properties=properties
         )
     
+    def _to_literal(self, node):
+        """Convert a legacy Num/Str/Bool node to its *Literal counterpart"""
+        node_type = type(node)
+        if node_type is Num:
+            return NumberLiteral(value=node.value)
+        if node_type is Str:
+            return StringLiteral(value=node.value)
+        if node_type is Bool:
+            return BooleanLiteral(value=node.value)
+        return node
+    
     def parse_relational_variable(self) -> RelationalVariable:
         """
         Parse relational variable declarations from YorubaNumeralSystem.
@@ -487,8 +527,8 @@ class Parser:
         name = name_token.value
         
         # Consume '='
-        eq_token = self.peek()
-        if not (isinstance(eq_token, Operator) and eq_token.value == '='):
+        eq_token = self._cur
+        if not (eq_token is not None and eq_token.kind == KIND_OPERATOR and eq_token.value == '='):
             raise SyntaxError("Expected '=' after variable name")
         self.advance()
         
@@ -499,17 +539,17 @@ class Parser:
         # Can be either: Keyword('relative') + Keyword('to')
         #           or:  Operator('relative_to')
         relative_to_clause = None
-        next_token = self.peek()
+        next_token = self._cur
         
         if next_token:
             # Check for Operator('relative_to')
-            if isinstance(next_token, Operator) and next_token.value == 'relative_to':
+            if next_token.kind == KIND_OPERATOR and next_token.value == 'relative_to':
                 self.advance()  # Consume relative_to
             # Or check for Keyword('relative') + Keyword('to')
-            elif isinstance(next_token, Keyword) and next_token.value.lower() == 'relative':
+            elif next_token.kind == KIND_KEYWORD and next_token.value_lc == 'relative':
                 self.advance()  # Consume 'relative'
-                to_token = self.peek()
-                if not (isinstance(to_token, Keyword) and to_token.value.lower() == 'to'):
+                to_token = self._cur
+                if not (to_token is not None and to_token.kind == KIND_KEYWORD and to_token.value_lc == 'to'):
                     raise SyntaxError("Expected 'to' after 'relative'")
                 self.advance()  # Consume 'to'
             else:
@@ -521,42 +561,42 @@ class Parser:
                 )
             
             # Parse anchor list [anchor1, anchor2]
-            bracket_open = self.peek()
-            if not (isinstance(bracket_open, Operator) and bracket_open.value == '['):
+            bracket_open = self._cur
+            if not (bracket_open is not None and bracket_open.kind == KIND_OPERATOR and bracket_open.value == '['):
                 raise SyntaxError("Expected '[' to start anchor list")
             self.advance()
             
             # Parse anchor names
             anchors = []
             while True:
-                anchor_name = self.consume(Identifier, "Expected anchor name").value
-                anchors.append(anchor_name)
+                name_token = self._cur
+                if name_token is None or name_token.kind != KIND_IDENTIFIER:
+                    raise SyntaxError("Expected anchor name")
+                anchors.append(name_token.value)
+                self.advance()
                 
-                next_token = self.peek()
-                if isinstance(next_token, Operator) and next_token.value == ',':
-                    self.advance()
-                    continue
-                elif isinstance(next_token, Operator) and next_token.value == ']':
-                    self.advance()
-                    break
-                else:
-                    raise SyntaxError("Expected ',' or ']' in anchor list")
+                separator = self._cur
+                if separator is not None and separator.kind == KIND_OPERATOR:
+                    if separator.value == ',':
+                        self.advance()
+                        continue
+                    if separator.value == ']':
+                        self.advance()
+                        break
+                raise SyntaxError("Expected ',' or ']' in anchor list")
             
             relative_to_clause = RelativeToClause(anchors=anchors)
         
         # Parse optional properties (context, policy, confidence, etc.)
         properties = {}
-        while self.peek():
-            next_token = self.peek()
+        while self._cur is not None:
+            next_token = self._cur
             
             # Accept both Identifier and Keyword for property names
             # (keywords like 'context', 'confidence', 'policy' can be property names)
-            if isinstance(next_token, (Identifier, Keyword)):
+            if next_token.kind in (KIND_IDENTIFIER, KIND_KEYWORD):
                 # Check if it's a statement keyword (not a property)
-                if isinstance(next_token, Keyword) and next_token.value.lower() in [
-                    'talk', 'relational', 'when', 'list', 'describe', 
-                    'anchor', 'suppose', 'den', 'make', 'repeat', 'stop'
-                ]:
+                if next_token.kind == KIND_KEYWORD and next_token.value_lc in _STATEMENT_START_KEYWORDS:
                     break  # Start of next statement
                 
                 # Consume the property name
@@ -564,8 +604,8 @@ class Parser:
                 prop_name = next_token.value
                 
                 # Check for '=' after property name
-                eq = self.peek()
-                if not (isinstance(eq, Operator) and eq.value == '='):
+                eq = self._cur
+                if not (eq is not None and eq.kind == KIND_OPERATOR and eq.value == '='):
                     # Not a property assignment
                     break
                 self.advance()  # Consume '='
@@ -573,12 +613,7 @@ class Parser:
                 prop_value = self.parse_expression()
                 
                 # Convert to literals
-                if isinstance(prop_value, Num):
-                    prop_value = NumberLiteral(value=prop_value.value)
-                elif isinstance(prop_value, Str):
-                    prop_value = StringLiteral(value=prop_value.value)
-                elif isinstance(prop_value, Bool):
-                    prop_value = BooleanLiteral(value=prop_value.value)
+                prop_value = self._to_literal(prop_value)
                 
                 properties[prop_name] = prop_value
             else:
@@ -605,8 +640,8 @@ class Parser:
         condition = self.parse_relational_expression()
         
         # Consume ':'
-        colon_token = self.peek()
-        if not (isinstance(colon_token, Operator) and colon_token.value == ':'):
+        colon_token = self._cur
+        if not (colon_token is not None and colon_token.kind == KIND_OPERATOR and colon_token.value == ':'):
             raise SyntaxError("Expected ':' after when condition")
         self.advance()
         
@@ -614,12 +649,12 @@ class Parser:
         actions = []
         
         # If next is @action, parse it
-        if (self.peek() and isinstance(self.peek(), Operator) and 
-            self.peek().value == '@'):
+        at_token = self._cur
+        if at_token and at_token.kind == KIND_OPERATOR and at_token.value == '@':
             self.advance()  # Skip @
             
-            action_kw = self.peek()
-            if isinstance(action_kw, Keyword) and action_kw.value.lower() == 'action':
+            action_kw = self._cur
+            if action_kw is not None and action_kw.kind == KIND_KEYWORD and action_kw.value_lc == 'action':
                 self.advance()  # Skip 'action'
                 
                 # Parse the action statement
@@ -643,17 +678,17 @@ class Parser:
         """
         left = self.parse_expression()
         
-        op_token = self.peek()
-        if isinstance(op_token, Keyword):
-            op = op_token.value.lower()
+        op_token = self._cur
+        if op_token is not None and op_token.kind == KIND_KEYWORD:
+            op = op_token.value_lc
             
             if op == 'is':
                 self.advance()
                 
                 # Parse qualifier ("over", "under", etc.)
                 qualifier = ""
-                rel_token = self.peek()
-                if isinstance(rel_token, String):
+                rel_token = self._cur
+                if rel_token is not None and rel_token.kind == KIND_STRING:
                     qualifier = rel_token.value
                     self.advance()
                 
@@ -666,7 +701,7 @@ class Parser:
                     right=Var(anchor_ref)
                 )
             
-            elif op in ['approaches', 'enters', 'leaves', 'crosses']:
+            elif op in _THRESHOLD_OPERATORS:
                 self.advance()
                 threshold = self.parse_expression()
                 
@@ -691,26 +726,26 @@ class Parser:
         Example: @optimize for: - energy: minimize - comfort: maximize
         """
         # Consume @ operator
-        at_token = self.peek()
-        if not (isinstance(at_token, Operator) and at_token.value == '@'):
+        at_token = self._cur
+        if not (at_token is not None and at_token.kind == KIND_OPERATOR and at_token.value == '@'):
             raise SyntaxError("Expected '@' for optimization directive")
         self.advance()
         
         # Consume 'optimize' keyword
-        opt_token = self.peek()
-        if not (isinstance(opt_token, Keyword) and opt_token.value.lower() == 'optimize'):
+        opt_token = self._cur
+        if not (opt_token is not None and opt_token.kind == KIND_KEYWORD and opt_token.value_lc == 'optimize'):
             raise SyntaxError("Expected 'optimize' keyword after '@'")
         self.advance()
         
         # Consume 'for'
-        for_token = self.peek()
-        if not (isinstance(for_token, Keyword) and for_token.value.lower() == 'for'):
+        for_token = self._cur
+        if not (for_token is not None and for_token.kind == KIND_KEYWORD and for_token.value_lc == 'for'):
             raise SyntaxError("Expected 'for' after 'optimize'")
         self.advance()
         
         # Consume ':'
-        colon_token = self.peek()
-        if not (isinstance(colon_token, Operator) and colon_token.value == ':'):
+        colon_token = self._cur
+        if not (colon_token is not None and colon_token.kind == KIND_OPERATOR and colon_token.value == ':'):
             raise SyntaxError("Expected ':' after 'for'")
         self.advance()
         
@@ -753,30 +788,26 @@ class Parser:
     
     def peek(self):
         """Get current token without advancing"""
-        if self.is_at_end():
-            return None
-        return self.tokens[self.current]
+        return self._cur
     
-    def peek_ahead(self, offset):
-        """Peek ahead by offset tokens"""
-        pos = self.current + offset
-        if pos >= len(self.tokens):
-            return None
-        return self.tokens[pos]
+    def _peek1(self):
+        """Get the token after the current one without advancing"""
+        return self._next
 
     def advance(self):
         """Consume current token and move to next"""
-        if not self.is_at_end():
-            self.current += 1
+        if self._cur is not None:
+            self._cur = self._next
+            self._next = next(self._stream, None)
 
     def is_at_end(self):
         """Check if we've reached end of tokens"""
-        return self.current >= len(self.tokens)
+        return self._cur is None
 
     def consume(self, token_type, message):
         """Consume a token of expected type or raise error"""
-        token = self.peek()
-        if not token or not isinstance(token, token_type):
+        token = self._cur
+        if not token or token.kind != token_type.kind:
             raise SyntaxError(message)
         self.advance()
         return token
@@ -32,11 +32,17 @@ from enum import Enum
 # ============================================================================
 
 class ASTNode:
-    """Legacy base class for backward compatibility"""
-    pass
+    """Legacy base class for backward compatibility
+    
+    Nodes are allocated per source construct and read on every execution,
+    so every node class declares ``__slots__`` (modern nodes through
+    ``@dataclass(slots=True)``): no per-instance ``__dict__`` and faster
+    attribute access.
+    """
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class Node(ASTNode):
     """
     Base class for all modern AST nodes with location tracking.
@@ -69,10 +75,13 @@ class Node(ASTNode):
 
 class BinOp(ASTNode):
     """Binary operation (legacy)"""
+    __slots__ = ('left', 'op', 'right', '_op_fn')
+    
     def __init__(self, left, op, right):
         self.left = left
         self.op = op
         self.right = right
+        self._op_fn = None  # Resolved MathOperations.binary_handler(op)
     
     def __repr__(self):
         return f"BinOp({self.left} {self.op} {self.right})"
@@ -80,6 +89,8 @@ class BinOp(ASTNode):
 
 class UnaryOp(ASTNode):
     """Unary operation (legacy)"""
+    __slots__ = ('op', 'operand')
+    
     def __init__(self, op, operand):
         self.op = op
         self.operand = operand
@@ -90,6 +101,8 @@ class UnaryOp(ASTNode):
 
 class Assign(ASTNode):
     """Variable assignment (legacy)"""
+    __slots__ = ('var', 'expr')
+    
     def __init__(self, var, expr):
         self.var = var
         self.expr = expr
@@ -100,8 +113,11 @@ class Assign(ASTNode):
 
 class Var(ASTNode):
     """Variable reference (legacy) - treated as Expression for compatibility"""
+    __slots__ = ('name', '_slot_idx')
+    
     def __init__(self, name):
         self.name = name
+        self._slot_idx = None  # Variable slot, assigned by the compiler
     
     def __repr__(self):
         return f"Var({self.name})"
@@ -109,6 +125,8 @@ class Var(ASTNode):
 
 class Num(ASTNode):
     """Numeric literal (legacy) - treated as Expression for compatibility"""
+    __slots__ = ('value',)
+    
     def __init__(self, value):
         self.value = value
     
@@ -118,6 +136,8 @@ class Num(ASTNode):
 
 class Str(ASTNode):
     """String literal (legacy) - treated as Expression for compatibility"""
+    __slots__ = ('value',)
+    
     def __init__(self, value):
         self.value = value
     
@@ -127,6 +147,8 @@ class Str(ASTNode):
 
 class Bool(ASTNode):
     """Boolean literal (legacy) - treated as Expression for compatibility"""
+    __slots__ = ('value',)
+    
     def __init__(self, value):
         self.value = value
     
@@ -136,6 +158,8 @@ class Bool(ASTNode):
 
 class If(ASTNode):
     """Conditional statement (legacy)"""
+    __slots__ = ('condition', 'then_branch', 'else_branch')
+    
     def __init__(self, condition, then_branch, else_branch=None):
         self.condition = condition
         self.then_branch = then_branch
@@ -147,6 +171,8 @@ class If(ASTNode):
 
 class While(ASTNode):
     """While loop (legacy)"""
+    __slots__ = ('condition', 'body')
+    
     def __init__(self, condition, body):
         self.condition = condition
         self.body = body
@@ -157,6 +183,8 @@ class While(ASTNode):
 
 class Print(ASTNode):
     """Print statement (legacy)"""
+    __slots__ = ('expr',)
+    
     def __init__(self, expr):
         self.expr = expr
     
@@ -166,6 +194,8 @@ class Print(ASTNode):
 
 class FunctionDef(ASTNode):
     """Function definition (legacy)"""
+    __slots__ = ('name', 'params', 'body')
+    
     def __init__(self, name, params, body):
         self.name = name
         self.params = params
@@ -177,6 +207,8 @@ class FunctionDef(ASTNode):
 
 class FunctionCall(ASTNode):
     """Function call (legacy)"""
+    __slots__ = ('name', 'args')
+    
     def __init__(self, name, args):
         self.name = name
         self.args = args
@@ -187,6 +219,8 @@ class FunctionCall(ASTNode):
 
 class TryCatch(ASTNode):
     """Try-catch block (legacy)"""
+    __slots__ = ('try_block', 'catch_block')
+    
     def __init__(self, try_block, catch_block):
         self.try_block = try_block
         self.catch_block = catch_block
@@ -197,8 +231,19 @@ class TryCatch(ASTNode):
 
 class Block(ASTNode):
     """Block of statements (legacy)"""
+    __slots__ = ('statements', '_code')
+    
     def __init__(self, statements):
-        self.statements = statements
+        # A nested Block only groups statements, so splice its statements
+        # in and keep every block a single flat list
+        flat = []
+        for stmt in statements:
+            if isinstance(stmt, Block):
+                flat.extend(stmt.statements)
+            else:
+                flat.append(stmt)
+        self.statements = flat
+        self._code = None  # Compiled bytecode, filled on first run
     
     def __repr__(self):
         return f"Block({len(self.statements)} statements)"
@@ -206,6 +251,8 @@ class Block(ASTNode):
 
 class ListAnchors(ASTNode):
     """List all anchors statement"""
+    __slots__ = ()
+    
     def __init__(self):
         pass
     
@@ -215,6 +262,8 @@ class ListAnchors(ASTNode):
 
 class DescribeAnchor(ASTNode):
     """Describe specific anchor statement"""
+    __slots__ = ('anchor_name',)
+    
     def __init__(self, anchor_name):
         self.anchor_name = anchor_name
     
@@ -226,13 +275,13 @@ class DescribeAnchor(ASTNode):
 # MODERN NODES - Enhanced with type safety
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Expression(Node):
     """Base class for expressions that evaluate to values"""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Statement(Node):
     """Base class for statements that perform actions"""
     pass
@@ -242,7 +291,7 @@ class Statement(Node):
 # LITERAL NODES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class NumberLiteral(Expression):
     """Numeric literal (replaces LegacyNum)"""
     value: Union[int, float] = 0
@@ -257,7 +306,7 @@ class NumberLiteral(Expression):
         return cls(value=node.value)
 
 
-@dataclass
+@dataclass(slots=True)
 class StringLiteral(Expression):
     """String literal (replaces LegacyStr)"""
     value: str = ""
@@ -272,7 +321,7 @@ class StringLiteral(Expression):
         return cls(value=node.value)
 
 
-@dataclass
+@dataclass(slots=True)
 class BooleanLiteral(Expression):
     """Boolean literal (replaces LegacyBool)"""
     value: bool = False
@@ -291,7 +340,7 @@ class BooleanLiteral(Expression):
 # PIDGIN SYNTAX NODES (Enhanced)
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PidginVariable(Statement):
     """Variable assignment in Pidgin syntax (make, set, wetin be)"""
     identifier: str = ""
@@ -305,7 +354,7 @@ class PidginVariable(Statement):
             raise TypeError(f"Value must be Expression, got {type(self.value)}")
 
 
-@dataclass
+@dataclass(slots=True)
 class PidginPrint(Statement):
     """Print statement in Pidgin syntax (talk, show)"""
     expression: Optional[Expression] = None
@@ -318,7 +367,7 @@ class PidginPrint(Statement):
             raise TypeError(f"Expression must be Expression, got {type(self.expression)}")
 
 
-@dataclass
+@dataclass(slots=True)
 class PidginBinaryOp(Expression):
     """Binary operation (e.g., a + b, x > y)"""
     left: Optional[Expression] = None
@@ -332,7 +381,7 @@ class PidginBinaryOp(Expression):
             raise TypeError(f"Right operand must be Expression, got {type(self.right)}")
 
 
-@dataclass
+@dataclass(slots=True)
 class PidginUnaryOp(Expression):
     """Unary operation (e.g., -x, not y)"""
     op: str = "-"
@@ -357,7 +406,7 @@ class AnchorType(Enum):
         return f"AnchorType.{self.name}"
 
 
-@dataclass
+@dataclass(slots=True)
 class AnchorProperty(Node):
     """
     Property attached to an anchor (e.g., unit="°C", tolerance=5.0)
@@ -376,7 +425,7 @@ class AnchorProperty(Node):
             raise TypeError(f"Property value must be Expression, got {type(self.value)}")
 
 
-@dataclass
+@dataclass(slots=True)
 class AnchorDeclaration(Statement):
     """
     Declaration of a meaningful reference point (anchor).
@@ -416,7 +465,7 @@ class AnchorDeclaration(Statement):
         return self.get_property(key) is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class RelativeToClause(Node):
     """
     Specifies which anchors a variable is relative to.
@@ -434,7 +483,7 @@ class RelativeToClause(Node):
                 raise TypeError(f"Anchor must be str or AnchorReference, got {type(anchor)}")
 
 
-@dataclass
+@dataclass(slots=True)
 class AnchorReference(Expression):
     """
     Reference to an anchor, optionally with alias.
@@ -452,7 +501,7 @@ class AnchorReference(Expression):
             raise TypeError(f"Anchor alias must be string, got {type(self.alias)}")
 
 
-@dataclass
+@dataclass(slots=True)
 class RelationalVariable(Statement):
     """
     Declaration of a relational variable that knows its position relative to anchors.
@@ -479,11 +528,42 @@ class RelationalVariable(Statement):
             raise TypeError(f"relative_to must be RelativeToClause, got {type(self.relative_to)}")
 
 
-@dataclass
+# Interned relational operator ids (see RelationalExpression.operator_id).
+# 'enters' interns as OP_ENTERS_VALUE and becomes OP_ENTERS_RANGE when its
+# right operand is a RangeExpression.
+(OP_IS, OP_APPROACHES, OP_ENTERS_VALUE, OP_ENTERS_RANGE, OP_LEAVES, OP_CROSSES,
+ OP_VALUE, OP_UNKNOWN) = range(8)
+
+_OPERATOR_IDS = {
+    'is': OP_IS,
+    'approaches': OP_APPROACHES,
+    'enters': OP_ENTERS_VALUE,
+    'leaves': OP_LEAVES,
+    'crosses': OP_CROSSES,
+    '': OP_VALUE,  # no operator: the expression is just its left value
+}
+
+# Interned 'is' qualifier ids; anything unrecognised compares for equality
+QUAL_OVER, QUAL_UNDER, QUAL_NEAR, QUAL_EQ, QUAL_APPROX = range(5)
+
+_QUALIFIER_IDS = {
+    'over': QUAL_OVER,
+    'under': QUAL_UNDER,
+    'near': QUAL_NEAR,
+    'equal_to': QUAL_EQ,
+    'approximately': QUAL_APPROX,
+}
+
+
+@dataclass(slots=True)
 class RelationalExpression(Expression):
     """
     Expression involving relational operators (is, approaches, enters, etc.)
     
+    operator_id and qualifier_id are the interned forms of operator and
+    qualifier, resolved once at construction so the interpreter can
+    dispatch through a table instead of comparing strings.
+    
     Examples:
         - temperature is "over" optimal_temp
         - reactor_temp approaches danger_threshold
@@ -495,6 +575,26 @@ class RelationalExpression(Expression):
     qualifier: Optional[str] = None  # "over", "under", "near", "within", "far from"
     tolerance: Optional[Expression] = None
     significance: Optional[str] = None  # "CRITICAL", "SIGNIFICANT", "MODERATE", etc.
+    operator_id: int = field(default=OP_IS, init=False, repr=False, compare=False)
+    qualifier_id: int = field(default=QUAL_EQ, init=False, repr=False, compare=False)
+    # (context, anchor_version, anchor) from the last anchor lookup
+    _anchor_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # (anchor, left, generation, value, result) for literal-vs-anchor conditions
+    _result_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # (start, end) of a literal 'enters' range, read without evaluating
+    _range_bounds: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.operator_id = _OPERATOR_IDS.get(self.operator, OP_UNKNOWN)
+        self.qualifier_id = _QUALIFIER_IDS.get(self.qualifier, QUAL_EQ)
+        right = self.right
+        if self.operator_id == OP_ENTERS_VALUE and isinstance(right, RangeExpression):
+            self.operator_id = OP_ENTERS_RANGE
+            if (isinstance(right.start, (NumberLiteral, Num))
+                    and isinstance(right.end, (NumberLiteral, Num))):
+                self._range_bounds = (right.start.value, right.end.value)
+        # slots=True rebuilds the class, which breaks zero-argument super()
+        super(RelationalExpression, self).__post_init__()
     
     def validate(self):
         valid_operators = {'is', 'approaches', 'enters', 'leaves', 'crosses', 'trending', ''}
@@ -508,7 +608,7 @@ class RelationalExpression(Expression):
         if self.tolerance and not isinstance(self.tolerance, (Expression, ASTNode)):
             raise TypeError(f"Tolerance must be Expression or ASTNode, got {type(self.tolerance)}")
 
-@dataclass
+@dataclass(slots=True)
 class RangeExpression(Expression):
     """
     Represents a range (e.g., 10..20 or optimal_temp ± 5).
@@ -528,7 +628,7 @@ class RangeExpression(Expression):
             raise TypeError(f"Range end must be Expression, got {type(self.end)}")
 
 
-@dataclass
+@dataclass(slots=True)
 class WhenStatement(Statement):
     """
     Relational control flow statement (like if, but relationship-aware).
@@ -553,7 +653,7 @@ class WhenStatement(Statement):
             raise ValueError(f"Invalid priority: {self.priority}")
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionBlock(Node):
     """
     Block of actions with metadata.
@@ -565,6 +665,9 @@ class ActionBlock(Node):
     """
     actions: List['ActionStatement'] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    explanation: Optional[str] = None  # Shown when the when-clause triggers
+    # The actions' statements as one Block, built by the interpreter
+    _body: Optional['Block'] = field(default=None, init=False, repr=False, compare=False)
     
     def validate(self):
         # Validation relaxed - empty action blocks are allowed in Phase 2B
@@ -574,7 +677,7 @@ class ActionBlock(Node):
                 raise TypeError(f"Action must be ActionStatement, got {type(action)}")
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionStatement(Statement):
     """
     An action to take in response to a condition.
@@ -597,7 +700,7 @@ class ActionStatement(Statement):
             raise ValueError(f"Invalid priority: {self.priority}")
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionDeclaration(Statement):
     """
     Function declaration with relational types.
@@ -627,7 +730,7 @@ class FunctionDeclaration(Statement):
             raise TypeError(f"Body must be Block, got {type(self.body)}")
 
 
-@dataclass
+@dataclass(slots=True)
 class Parameter(Node):
     """
     Function parameter with optional decorators.
@@ -651,7 +754,7 @@ class Parameter(Node):
                 raise ValueError(f"Invalid decorator: {decorator}, must be one of {valid_decorators}")
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeSpecification(Node):
     """
     Type specification for relational types.
@@ -684,7 +787,7 @@ class TypeSpecification(Node):
 # Action blocks omitted - using ActionBlock class above
 
 
-@dataclass
+@dataclass(slots=True)
 class OptimizationDirective(Statement):
     """
     Specifies optimization goals for the system.
@@ -713,7 +816,7 @@ class OptimizationDirective(Statement):
 # RELATIONAL OPERATOR NODES (Specialized)
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class IsExpression(RelationalExpression):
     """
     'is' operator with qualifier (e.g., 'is over', 'is near').
@@ -723,10 +826,10 @@ class IsExpression(RelationalExpression):
     """
     def __post_init__(self):
         self.operator = "is"
-        super().__post_init__()
+        super(IsExpression, self).__post_init__()
 
 
-@dataclass
+@dataclass(slots=True)
 class ApproachesExpression(RelationalExpression):
     """
     'approaches' operator for detecting trends toward a threshold.
@@ -738,10 +841,10 @@ class ApproachesExpression(RelationalExpression):
     
     def __post_init__(self):
         self.operator = "approaches"
-        super().__post_init__()
+        super(ApproachesExpression, self).__post_init__()
 
 
-@dataclass
+@dataclass(slots=True)
 class EntersExpression(RelationalExpression):
     """
     'enters' operator for crossing into a range.
@@ -751,10 +854,10 @@ class EntersExpression(RelationalExpression):
     """
     def __post_init__(self):
         self.operator = "enters"
-        super().__post_init__()
+        super(EntersExpression, self).__post_init__()
 
 
-@dataclass
+@dataclass(slots=True)
 class LeavesExpression(RelationalExpression):
     """
     'leaves' operator for crossing out of a range.
@@ -764,14 +867,14 @@ class LeavesExpression(RelationalExpression):
     """
     def __post_init__(self):
         self.operator = "leaves"
-        super().__post_init__()
+        super(LeavesExpression, self).__post_init__()
 
 
 # ============================================================================
 # COMPOUND EXPRESSIONS
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class LogicalExpression(Expression):
     """
     Logical combination of conditions (and, or, but, except).
@@ -793,7 +896,7 @@ class LogicalExpression(Expression):
             raise TypeError(f"Right operand must be Expression, got {type(self.right)}")
 
 
-@dataclass
+@dataclass(slots=True)
 class WithProperties(Expression):
     """
     Expression with additional properties.
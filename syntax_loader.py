@@ -1,7 +1,7 @@
 """Syntax Loader: Loads and provides access to configurable syntax rules."""
 
 import json
-from typing import Dict, List, Any, Optional
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
 
 
 class SyntaxLoader:
@@ -10,10 +10,31 @@ class SyntaxLoader:
     def __init__(self, syntax_file: str = "syntax.json") -> None:
         with open(syntax_file, 'r', encoding='utf-8') as f:
             self.syntax: Dict[str, Any] = json.load(f)
+        # Hashed once; the lexer checks every identifier against it
+        self.keywords: FrozenSet[str] = frozenset(self.syntax.get("keywords", []))
+        # First word of each multi-word operator -> the words that may follow
+        self.multi_word_operators: Dict[str, FrozenSet[str]] = self._index_multi_word_operators()
+        # Punctuation operators and their distinct lengths, shortest first
+        self.symbol_operators: FrozenSet[str] = frozenset(
+            op for op in self.syntax.get("operators", {})
+            if op and not any(c.isalnum() or c.isspace() for c in op)
+        )
+        self.symbol_operator_lengths: Tuple[int, ...] = tuple(
+            sorted({len(op) for op in self.symbol_operators})
+        )
+    
+    def _index_multi_word_operators(self) -> Dict[str, FrozenSet[str]]:
+        """Group multi-word operators by their first word."""
+        index: Dict[str, set] = {}
+        for operator in self.syntax.get("operators", {}):
+            first, _, rest = operator.partition(' ')
+            if rest:
+                index.setdefault(first, set()).add(rest)
+        return {first: frozenset(rests) for first, rests in index.items()}
     
     def is_keyword(self, token: str) -> bool:
         """Check if token is a keyword."""
-        return token in self.syntax.get("keywords", [])
+        return token in self.keywords
     
     def is_operator(self, token: str) -> bool:
         """Check if token is an operator."""
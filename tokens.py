@@ -1,10 +1,26 @@
 """Token Definitions: Token classes for the GIANT programming language."""
 
+from sys import intern
 from typing import Any
 
 
+# Integer type tags, one per token class; the parser compares token.kind
+# against these rather than walking the MRO with isinstance()
+(KIND_KEYWORD, KIND_OPERATOR, KIND_IDENTIFIER,
+ KIND_INTEGER, KIND_STRING, KIND_BOOLEAN) = range(1, 7)
+
+
 class Token:
-    """Base token class."""
+    """Base token class.
+    
+    Tokens are slotted: a source file produces one per word, so dropping
+    the per-instance ``__dict__`` keeps the token list compact. Subclasses
+    fill their slots themselves instead of going through super().__init__.
+    """
+    
+    __slots__ = ('type', 'value')
+    
+    kind = 0
     
     def __init__(self, type: str, value: Any) -> None:
         self.type = type
@@ -23,40 +39,68 @@ class Token:
 class Keyword(Token):
     """Language keyword token."""
     
+    __slots__ = ('value_lc',)
+    kind = KIND_KEYWORD
+    
     def __init__(self, value: str) -> None:
-        super().__init__("KEYWORD", value)
+        self.type = "KEYWORD"
+        self.value = value
+        # Lowercased once here and interned, so the parser's compares and
+        # handler/set lookups against literal keywords match by identity
+        self.value_lc = intern(value.lower())
 
 
 class Identifier(Token):
     """Variable or function identifier token."""
     
+    __slots__ = ()
+    kind = KIND_IDENTIFIER
+    
     def __init__(self, value: str) -> None:
-        super().__init__("IDENTIFIER", value)
+        self.type = "IDENTIFIER"
+        self.value = value
 
 
 class Integer(Token):
     """Integer literal token."""
     
+    __slots__ = ()
+    kind = KIND_INTEGER
+    
     def __init__(self, value: Any) -> None:
-        super().__init__("INT", int(value))
+        self.type = "INT"
+        self.value = int(value)
 
 
 class String(Token):
     """String literal token."""
     
+    __slots__ = ()
+    kind = KIND_STRING
+    
     def __init__(self, value: str) -> None:
-        super().__init__("STRING", value)
+        self.type = "STRING"
+        self.value = value
 
 
 class Operator(Token):
     """Operator token."""
     
+    __slots__ = ('value_lc',)
+    kind = KIND_OPERATOR
+    
     def __init__(self, value: str) -> None:
-        super().__init__("OPERATOR", value)
+        self.type = "OPERATOR"
+        self.value = value
+        self.value_lc = intern(value.lower())
 
 
 class Boolean(Token):
     """Boolean literal token."""
     
+    __slots__ = ()
+    kind = KIND_BOOLEAN
+    
     def __init__(self, value: Any) -> None:
-        super().__init__("BOOL", value)
+        self.type = "BOOL"
+        self.value = value